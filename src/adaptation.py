@@ -663,8 +663,7 @@ if __name__ == "__main__":
         adaptations = engine.apply_insights([insight])
         if adaptations:
             print(f"  Applied: {adaptations[0]}")
-            rules = brain.get_active_rules()
-            time_rules = [r for r in rules if "time_filter" in r.rule_id]
+            time_rules = brain.get_rules_matching("time_filter")
             assert len(time_rules) > 0, "Should have time rule"
             print(f"  PASSED: Time rule created ({time_rules[0].rule_id})")
         else:
@@ -2,6 +2,7 @@
 
 import sqlite3
 import logging
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -35,8 +36,14 @@ class Database:
         Args:
             db_path: Optional path to database file.
                      Defaults to data/trading_bot.db in project root.
+                     Pass ":memory:" for a private in-memory database.
         """
-        if db_path is None:
+        self._memory_uri: Optional[str] = None
+        self._memory_anchor: Optional[sqlite3.Connection] = None
+
+        if db_path == ":memory:":
+            self._open_memory()
+        elif db_path is None:
             # Default to data/trading_bot.db relative to project root
             project_root = Path(__file__).parent.parent
             self.db_path = project_root / "data" / "trading_bot.db"
@@ -44,7 +51,8 @@ class Database:
             self.db_path = Path(db_path)
 
         # Ensure data directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._memory_uri is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Create tables on initialization
         self.create_tables()
@@ -54,13 +62,46 @@ class Database:
 
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _open_memory(self) -> None:
+        """Point this instance at a new private in-memory database.
+
+        Every sqlite3.connect(":memory:") opens a new empty database, so use
+        a named shared-cache URI and hold one connection open to keep it
+        alive for the lifetime of this instance.
+        """
+        self.db_path = Path(":memory:")
+        self._memory_uri = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self._memory_anchor = sqlite3.connect(self._memory_uri, uri=True)
+
+    def clone(self) -> "Database":
+        """Copy this database into a new private in-memory Database.
+
+        Pages are copied with the SQLite backup API, so the copy skips
+        table creation and account-state seeding. Tests use this to restore
+        a prepared template cheaply instead of building a database per test.
+
+        Returns:
+            An independent in-memory Database with the same contents.
+        """
+        copy = Database.__new__(Database)  # Contents come from the backup, not __init__
+        copy._open_memory()
+        src = self._get_connection()
+        try:
+            src.backup(copy._memory_anchor)
+        finally:
+            src.close()
+        return copy
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with row factory enabled.
 
         Returns:
             sqlite3.Connection configured for dict-like row access.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        if self._memory_uri is not None:
+            conn = sqlite3.connect(self._memory_uri, uri=True)
+        else:
+            conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -334,6 +375,10 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_journal_coin
                 ON trade_journal(coin)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_position
+                ON trade_journal(position_id)
+            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_journal_strategy
                 ON trade_journal(strategy_id)
@@ -1328,6 +1373,40 @@ class Database:
             logger.info(f"Logged adaptation: [{action}] {target}")
             return cursor.lastrowid
 
+    def log_adaptations(self, adaptations: List[Dict[str, Any]]) -> int:
+        """Log several adaptations in a single transaction.
+
+        Args:
+            adaptations: List of dicts with the same keys as log_adaptation's
+                arguments. Optional keys fall back to the same defaults.
+
+        Returns:
+            Number of adaptations inserted.
+        """
+        rows = [
+            (
+                a["adaptation_id"],
+                a["insight_type"],
+                a["action"],
+                a["target"],
+                a["description"],
+                a.get("pre_metrics", "{}"),
+                a.get("insight_confidence", 0.0),
+                a.get("insight_evidence", "{}"),
+            )
+            for a in adaptations
+        ]
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO adaptations
+                (adaptation_id, insight_type, action, target, description,
+                 pre_metrics, insight_confidence, insight_evidence)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        logger.info(f"Logged {len(rows)} adaptations")
+        return len(rows)
+
     def get_adaptations(self, hours: int = 24, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent adaptations from the adaptations table.
 
@@ -12,7 +12,8 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.adaptation import AdaptationEngine
@@ -34,9 +35,9 @@ class EffectivenessRating(Enum):
     PENDING = "pending"                     # Not enough data yet
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EffectivenessResult:
-    """Result of effectiveness measurement."""
+    """Result of effectiveness measurement. Immutable once measured."""
     adaptation_id: str
     rating: EffectivenessRating
 
@@ -77,6 +78,73 @@ class EffectivenessResult:
         }
 
 
+@lru_cache(maxsize=256)
+def _score_change(
+    pre_win_rate: float,
+    post_win_rate: float,
+    pre_pnl: float,
+    post_pnl: float,
+    pre_pf: float,
+    post_pf: float,
+    trades_measured: int,
+    thresholds: Tuple[float, float, float, float, float, int],
+) -> Tuple[EffectivenessRating, float, float, float, bool, Optional[str]]:
+    """Rate a pre/post metric change.
+
+    Memoized on scalar inputs because many adaptations are scored against
+    the same baseline window.
+
+    Args:
+        thresholds: (highly_effective, effective, ineffective, harmful,
+            rollback_min_pnl_loss, rollback_min_trades).
+
+    Returns:
+        (rating, win_rate_change, pnl_change, pf_change,
+         should_rollback, rollback_reason)
+    """
+    (
+        highly_effective,
+        effective,
+        ineffective,
+        harmful,
+        rollback_min_pnl_loss,
+        rollback_min_trades,
+    ) = thresholds
+
+    # Calculate changes
+    win_rate_change = post_win_rate - pre_win_rate
+    pnl_change = post_pnl - pre_pnl
+    pf_change = post_pf - pre_pf
+
+    # Assign rating based on win rate change
+    if win_rate_change >= highly_effective:
+        rating = EffectivenessRating.HIGHLY_EFFECTIVE
+    elif win_rate_change >= effective:
+        rating = EffectivenessRating.EFFECTIVE
+    elif win_rate_change >= ineffective:
+        rating = EffectivenessRating.NEUTRAL
+    elif win_rate_change >= harmful:
+        rating = EffectivenessRating.INEFFECTIVE
+    else:
+        rating = EffectivenessRating.HARMFUL
+
+    # Determine if rollback needed
+    should_rollback = (
+        rating == EffectivenessRating.HARMFUL and
+        pnl_change < -rollback_min_pnl_loss and
+        trades_measured >= rollback_min_trades
+    )
+
+    rollback_reason = None
+    if should_rollback:
+        rollback_reason = (
+            f"Win rate dropped {abs(win_rate_change):.1f}% and "
+            f"lost ${abs(pnl_change):.2f} over {trades_measured} trades"
+        )
+
+    return rating, win_rate_change, pnl_change, pf_change, should_rollback, rollback_reason
+
+
 class EffectivenessMonitor:
     """Monitors adaptation effectiveness and flags harmful changes.
 
@@ -270,18 +338,8 @@ class EffectivenessMonitor:
         """
         hours_since = (datetime.now() - since).total_seconds() / 3600
 
-        # Get trades since adaptation
-        trades = self.journal.get_recent(
-            hours=int(hours_since) + 1,
-            status="closed",
-            limit=10000,
-        )
-
-        # Filter to only trades after adaptation
-        trades_after = [
-            t for t in trades
-            if t.exit_time and t.exit_time > since
-        ]
+        # Journal filters on exit_time itself, newest first
+        trades_after = self.journal.get_closed_after(since, limit=10000)
 
         # Calculate metrics
         if trades_after:
@@ -318,6 +376,8 @@ class EffectivenessMonitor:
     ) -> EffectivenessResult:
         """Compare pre/post metrics and assign rating.
 
+        Side-effect free: reads only its arguments and class thresholds.
+
         Args:
             adaptation_id: ID of adaptation.
             pre_metrics: Metrics before adaptation.
@@ -332,46 +392,31 @@ class EffectivenessMonitor:
         pre_overall = pre_metrics.get("overall", pre_metrics)
         post_overall = post_metrics.get("overall", post_metrics)
 
-        pre_win_rate = pre_overall.get("win_rate", 0.0)
-        post_win_rate = post_overall.get("win_rate", 0.0)
-
-        pre_pnl = pre_overall.get("total_pnl", 0.0)
-        post_pnl = post_overall.get("total_pnl", 0.0)
-
-        pre_pf = pre_overall.get("profit_factor", 0.0)
-        post_pf = post_overall.get("profit_factor", 0.0)
-
-        # Calculate changes
-        win_rate_change = post_win_rate - pre_win_rate
-        pnl_change = post_pnl - pre_pnl
-        pf_change = post_pf - pre_pf
-
-        # Assign rating based on win rate change
-        if win_rate_change >= self.HIGHLY_EFFECTIVE_THRESHOLD:
-            rating = EffectivenessRating.HIGHLY_EFFECTIVE
-        elif win_rate_change >= self.EFFECTIVE_THRESHOLD:
-            rating = EffectivenessRating.EFFECTIVE
-        elif win_rate_change >= self.INEFFECTIVE_THRESHOLD:
-            rating = EffectivenessRating.NEUTRAL
-        elif win_rate_change >= self.HARMFUL_THRESHOLD:
-            rating = EffectivenessRating.INEFFECTIVE
-        else:
-            rating = EffectivenessRating.HARMFUL
-
-        # Determine if rollback needed
-        should_rollback = (
-            rating == EffectivenessRating.HARMFUL and
-            pnl_change < -self.ROLLBACK_MIN_PNL_LOSS and
-            trades_measured >= self.ROLLBACK_MIN_TRADES
+        (
+            rating,
+            win_rate_change,
+            pnl_change,
+            pf_change,
+            should_rollback,
+            rollback_reason,
+        ) = _score_change(
+            pre_overall.get("win_rate", 0.0),
+            post_overall.get("win_rate", 0.0),
+            pre_overall.get("total_pnl", 0.0),
+            post_overall.get("total_pnl", 0.0),
+            pre_overall.get("profit_factor", 0.0),
+            post_overall.get("profit_factor", 0.0),
+            trades_measured,
+            (
+                self.HIGHLY_EFFECTIVE_THRESHOLD,
+                self.EFFECTIVE_THRESHOLD,
+                self.INEFFECTIVE_THRESHOLD,
+                self.HARMFUL_THRESHOLD,
+                self.ROLLBACK_MIN_PNL_LOSS,
+                self.ROLLBACK_MIN_TRADES,
+            ),
         )
 
-        rollback_reason = None
-        if should_rollback:
-            rollback_reason = (
-                f"Win rate dropped {abs(win_rate_change):.1f}% and "
-                f"lost ${abs(pnl_change):.2f} over {trades_measured} trades"
-            )
-
         return EffectivenessResult(
             adaptation_id=adaptation_id,
             rating=rating,
@@ -13,12 +13,14 @@ import asyncio
 import logging
 import sqlite3
 import threading
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 from queue import Queue, Empty
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, Any, Iterable, Iterator
 
 from src.calculations import calculate_pnl_percentage
 
@@ -172,23 +174,42 @@ class JournalDatabase:
     """
 
     def __init__(self, db_path: Optional[str] = None):
-        if db_path is None:
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.RLock()
+
+        if db_path == ":memory:":
+            # One connection shared by every caller, including the async
+            # writer thread, and serialised by a lock. Several connections to
+            # a shared-cache database would fail with "table is locked" on
+            # concurrent access, and busy_timeout does not cover that error.
+            self.db_path = Path(db_path)
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._memory_conn.row_factory = sqlite3.Row
+        elif db_path is None:
             project_root = Path(__file__).parent.parent
             self.db_path = project_root / "data" / "trading_bot.db"
         else:
             self.db_path = Path(db_path)
 
         # Ensure directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._memory_conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize table
         self._create_table()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a database connection; commits on success, rolls back on error."""
+        if self._memory_conn is not None:
+            with self._memory_lock, self._memory_conn as conn:
+                yield conn
+            return
+
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
-        return conn
+        with conn:
+            yield conn
 
     def _create_table(self) -> None:
         """Create trade_journal table if not exists."""
@@ -232,33 +253,104 @@ class JournalDatabase:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # get_by_position() backs exit recording and post-trade updates
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_position
+                ON trade_journal(position_id)
+            """)
+            # get_by_coin() and per-coin get_stats() filter on coin
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_coin
+                ON trade_journal(coin)
+            """)
+            # get_by_strategy() / get_by_exit_reason() filters
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_strategy
+                ON trade_journal(strategy_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_exit_reason
+                ON trade_journal(exit_reason)
+            """)
+            # get_winners() / get_losers() range-scan and order by P&L
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_journal_pnl
+                ON trade_journal(pnl_usd)
+            """)
             conn.commit()
 
-    def insert(self, entry: JournalEntry) -> None:
-        """Insert a new journal entry."""
+    @staticmethod
+    def _insert_statement(entry: JournalEntry) -> tuple[str, list]:
+        """Build the INSERT OR REPLACE statement and parameters for an entry."""
         d = entry.to_dict()
         columns = ', '.join(d.keys())
         placeholders = ', '.join(['?' for _ in d])
+        return (
+            f"INSERT OR REPLACE INTO trade_journal ({columns}) VALUES ({placeholders})",
+            list(d.values()),
+        )
+
+    @staticmethod
+    def _update_statement(entry_id: str, updates: dict) -> tuple[str, list]:
+        """Build the UPDATE statement and parameters; stamps updated_at."""
+        updates['updated_at'] = datetime.now().isoformat()
+        set_clause = ', '.join(f"{k} = ?" for k in updates.keys())
+        return (
+            f"UPDATE trade_journal SET {set_clause} WHERE id = ?",
+            list(updates.values()) + [entry_id],
+        )
 
+    def insert(self, entry: JournalEntry) -> None:
+        """Insert a new journal entry."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.execute(*self._insert_statement(entry))
+            conn.commit()
+
+    def insert_many(self, entries: Iterable[JournalEntry]) -> None:
+        """Insert several journal entries in one statement and transaction."""
+        rows = [entry.to_dict() for entry in entries]
+        if not rows:
+            return
+        columns = ', '.join(rows[0].keys())
+        placeholders = ', '.join(['?' for _ in rows[0]])
+
+        with self._get_connection() as conn:
+            conn.executemany(
                 f"INSERT OR REPLACE INTO trade_journal ({columns}) VALUES ({placeholders})",
-                list(d.values())
+                [list(d.values()) for d in rows]
             )
             conn.commit()
 
     def update(self, entry_id: str, updates: dict) -> None:
         """Update an existing entry."""
-        updates['updated_at'] = datetime.now().isoformat()
-        set_clause = ', '.join(f"{k} = ?" for k in updates.keys())
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(*self._update_statement(entry_id, updates))
+            conn.commit()
+
+    def write_many(self, writes: Iterable[tuple[str, Any]]) -> None:
+        """Apply queued writes in order on one connection and one commit.
+
+        Args:
+            writes: ('insert', entry) and ('update', (entry_id, updates))
+                items, the same shape AsyncWriteQueue holds.
+        """
+        statements = []
+        for operation, args in writes:
+            if operation == 'insert':
+                statements.append(self._insert_statement(args))
+            elif operation == 'update':
+                statements.append(self._update_statement(*args))
+            else:
+                raise ValueError(f"Unknown journal write: {operation}")
+        if not statements:
+            return
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                f"UPDATE trade_journal SET {set_clause} WHERE id = ?",
-                list(updates.values()) + [entry_id]
-            )
+            for sql, params in statements:
+                cursor.execute(sql, params)
             conn.commit()
 
     def get(self, entry_id: str) -> Optional[JournalEntry]:
@@ -356,18 +448,46 @@ class AsyncWriteQueue:
         """Stop the background writer and flush remaining writes."""
         self._running = False
         if self._thread:
+            self.queue.put(None)  # Wake the writer instead of waiting out its poll
             self._thread.join(timeout=5.0)
 
         # Flush remaining items
-        while not self.queue.empty():
+        while True:
             try:
-                operation, args = self.queue.get_nowait()
-                self._execute(operation, args)
+                item = self.queue.get_nowait()
             except Empty:
                 break
+            if item is not None:
+                self._execute(*item)
+            self.queue.task_done()
 
         logger.debug("Async write queue stopped")
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every queued write has been applied.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer thread
+
+        Returns:
+            True if the queue drained, False if the timeout expired first
+        """
+        if not self._running:
+            return True
+
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        f"Write queue flush timed out with "
+                        f"{self.queue.unfinished_tasks} writes pending"
+                    )
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
     def enqueue_insert(self, entry: JournalEntry) -> None:
         """Queue an insert operation."""
         self.queue.put(('insert', entry))
@@ -380,12 +500,17 @@ class AsyncWriteQueue:
         """Process queued writes in background thread."""
         while self._running:
             try:
-                operation, args = self.queue.get(timeout=0.5)
-                self._execute(operation, args)
+                item = self.queue.get(timeout=0.5)
             except Empty:
                 continue
+            try:
+                if item is not None:
+                    operation, args = item
+                    self._execute(operation, args)
             except Exception as e:
                 logger.error(f"Write queue error: {e}")
+            finally:
+                self.queue.task_done()
 
     def _execute(self, operation: str, args: Any) -> None:
         """Execute a queued operation."""
@@ -438,7 +563,8 @@ class TradeJournal:
         Initialize the Trade Journal.
 
         Args:
-            db_path: Path to SQLite database (default: data/trading_bot.db)
+            db_path: Path to SQLite database (default: data/trading_bot.db),
+                or ":memory:" for a private in-memory journal
             market_feed: MarketFeed for post-trade price capture
             enable_async: Use async write queue (default True)
         """
@@ -454,6 +580,9 @@ class TradeJournal:
             self._write_queue = AsyncWriteQueue(self.db)
             self._write_queue.start()
 
+        # Synchronous writes held back while inside batch(), else None
+        self._deferred_writes: Optional[list[tuple[str, Any]]] = None
+
         # Post-trade capture tasks
         self._post_trade_tasks: dict[str, asyncio.Task] = {}
 
@@ -474,6 +603,35 @@ class TradeJournal:
         if open_entries:
             logger.info(f"Loaded {len(open_entries)} open journal entries")
 
+    @contextmanager
+    def batch(self) -> Iterator["TradeJournal"]:
+        """Defer synchronous journal writes until the block exits.
+
+        Entries and exits recorded inside the block are written on one
+        connection with a single commit, and only if the block completes.
+        If it raises, the deferred writes are discarded; the in-memory
+        pending_entries cache is not rolled back, so it may still hold
+        entries recorded inside the block. Nested batches join the outer
+        one. Has no effect when the async write queue is enabled.
+
+        Example:
+            >>> with journal.batch():
+            ...     journal.record_entry(position, entry_ts)
+            ...     journal.record_exit(position, price, exit_ts, "manual", pnl)
+        """
+        if self._deferred_writes is not None:
+            yield self
+            return
+
+        self._deferred_writes = []
+        try:
+            yield self
+        except BaseException:
+            self._deferred_writes = None
+            raise
+        writes, self._deferred_writes = self._deferred_writes, None
+        self.db.write_many(writes)
+
     def _generate_id(self) -> str:
         """Generate unique entry ID."""
         self._entry_count += 1
@@ -536,6 +694,8 @@ class TradeJournal:
         # Queue async write
         if self._write_queue:
             self._write_queue.enqueue_insert(entry)
+        elif self._deferred_writes is not None:
+            self._deferred_writes.append(('insert', entry))
         else:
             self.db.insert(entry)
 
@@ -606,6 +766,8 @@ class TradeJournal:
         # Queue async write
         if self._write_queue:
             self._write_queue.enqueue_update(entry.id, updates)
+        elif self._deferred_writes is not None:
+            self._deferred_writes.append(('update', (entry.id, updates)))
         else:
             self.db.update(entry.id, updates)
 
@@ -620,6 +782,38 @@ class TradeJournal:
 
         return entry.id
 
+    def record_batch(self, trades: Iterable[dict]) -> list[Optional[str]]:
+        """
+        Record completed trades (entry and exit) with a single commit.
+
+        Each trade goes through record_entry() and record_exit(), so rows get
+        the same derived fields (timing, P&L %, duration) as live trades.
+        Writes are deferred by batch(); with the async write queue enabled
+        they are queued as usual instead.
+
+        Args:
+            trades: Dicts with the record_entry()/record_exit() arguments:
+                position, entry_timestamp, exit_price, exit_timestamp,
+                reason, pnl, and optionally market_context
+
+        Returns:
+            The journal entry IDs, in input order
+        """
+        entry_ids = []
+        with self.batch():
+            for trade in trades:
+                position = trade['position']
+                self.record_entry(position, trade['entry_timestamp'],
+                                  trade.get('market_context'))
+                entry_ids.append(self.record_exit(
+                    position=position,
+                    exit_price=trade['exit_price'],
+                    timestamp=trade['exit_timestamp'],
+                    reason=trade['reason'],
+                    pnl=trade['pnl'],
+                ))
+        return entry_ids
+
     # =========================================================================
     # Post-Trade Price Capture
     # =========================================================================
@@ -748,10 +942,10 @@ class TradeJournal:
         except Exception as e:
             logger.error(f"Post-trade capture error: {e}")
 
-    def _calculate_missed_profit(self,
-                                  direction: str,
-                                  exit_price: float,
-                                  later_price: float) -> float:
+    @staticmethod
+    def _calculate_missed_profit(direction: str,
+                                 exit_price: float,
+                                 later_price: float) -> float:
         """
         Calculate profit missed by exiting when we did.
 
@@ -805,6 +999,25 @@ class TradeJournal:
 
         return self.db.query(where=where, params=params, limit=limit)
 
+    def get_closed_after(self, since: datetime, limit: int = 10000) -> list[JournalEntry]:
+        """
+        Get closed entries that exited after a point in time.
+
+        Filters on exit_time in SQL so callers don't have to pull a wider
+        entry_time window and filter in Python. Results are newest first,
+        so when more entries qualify than ``limit`` the most recent are kept.
+
+        Args:
+            since: Only entries with exit_time strictly after this
+            limit: Maximum entries to return
+        """
+        return self.db.query(
+            where="status = 'closed' AND exit_time > ?",
+            params=(since.isoformat(),),
+            order_by="exit_time DESC",
+            limit=limit
+        )
+
     def get_by_coin(self, coin: str, limit: int = 100) -> list[JournalEntry]:
         """Get entries for a specific coin."""
         return self.db.query(
@@ -1093,6 +1306,16 @@ class TradeJournal:
     # Lifecycle
     # =========================================================================
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued journal writes have reached the database.
+
+        Returns:
+            True if every write landed, False if the timeout expired first
+        """
+        if self._write_queue:
+            return self._write_queue.flush(timeout)
+        return True
+
     def stop(self) -> None:
         """Stop async operations and flush writes."""
         # Cancel post-trade tasks
@@ -10,8 +10,9 @@ All data persists to SQLite database.
 """
 
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
 
 from src.database import Database
 from src.models.knowledge import CoinScore, TradingPattern, RegimeRule
@@ -44,6 +45,11 @@ class KnowledgeBrain:
         self._coin_scores: Dict[str, CoinScore] = {}
         self._patterns: Dict[str, TradingPattern] = {}
         self._regime_rules: Dict[str, RegimeRule] = {}
+        # Coins with unsaved score updates while inside batch(), else None
+        self._deferred_coins: Optional[Set[str]] = None
+        # Bumped on every coin score insert or change; keys the get_good_coins() cache
+        self._version: int = 0
+        self._good_coins_cache: Optional[Tuple[Tuple[int, int, float], List[str]]] = None
         self._load_from_db()
         logger.info(f"KnowledgeBrain initialized: {len(self._coin_scores)} coins, "
                    f"{len(self._patterns)} patterns, {len(self._regime_rules)} rules")
@@ -65,6 +71,35 @@ class KnowledgeBrain:
             rule = RegimeRule.from_dict(row)
             self._regime_rules[rule.rule_id] = rule
 
+    @contextmanager
+    def batch(self) -> Iterator["KnowledgeBrain"]:
+        """Defer coin score writes until the block exits.
+
+        Each coin updated inside the block is saved once on exit instead of
+        once per update_coin_score() call, and only if the block completes.
+        If it raises, the deferred saves are discarded; in-memory scores are
+        not rolled back, so they may be ahead of the database until the coin
+        is next saved. Nested batches join the outer one.
+
+        Example:
+            >>> with brain.batch():
+            ...     for result in results:
+            ...         brain.update_coin_score("SOL", result)
+        """
+        if self._deferred_coins is not None:
+            yield self
+            return
+
+        self._deferred_coins = set()
+        try:
+            yield self
+        except BaseException:
+            self._deferred_coins = None
+            raise
+        coins, self._deferred_coins = self._deferred_coins, None
+        for coin in coins:
+            self.db.save_coin_score(self._coin_scores[coin].to_dict())
+
     # ========== Coin Scores ==========
 
     def get_coin_score(self, coin: str) -> Optional[CoinScore]:
@@ -130,9 +165,13 @@ class KnowledgeBrain:
 
         # Update trend based on recent performance
         score.trend = self._calculate_trend(score)
+        self._version += 1
 
-        # Persist to database
-        self.db.save_coin_score(score.to_dict())
+        # Persist to database (once per coin at the end of a batch)
+        if self._deferred_coins is not None:
+            self._deferred_coins.add(coin)
+        else:
+            self.db.save_coin_score(score.to_dict())
 
         logger.debug(f"Updated {coin} score: {score.total_trades} trades, "
                     f"{score.win_rate:.1%} win rate, ${score.total_pnl:.2f} total P&L")
@@ -170,12 +209,16 @@ class KnowledgeBrain:
         Returns:
             List of coin symbols meeting criteria.
         """
-        return [
-            score.coin for score in self._coin_scores.values()
-            if score.total_trades >= min_trades
-            and score.win_rate >= min_win_rate
-            and not score.is_blacklisted
-        ]
+        key = (self._version, min_trades, min_win_rate)
+        if self._good_coins_cache is None or self._good_coins_cache[0] != key:
+            coins = [
+                score.coin for score in self._coin_scores.values()
+                if score.total_trades >= min_trades
+                and score.win_rate >= min_win_rate
+                and not score.is_blacklisted
+            ]
+            self._good_coins_cache = (key, coins)
+        return list(self._good_coins_cache[1])
 
     def get_bad_coins(self, min_trades: int = 5, max_win_rate: float = 0.35) -> List[str]:
         """Get coins with poor performance.
@@ -210,6 +253,7 @@ class KnowledgeBrain:
         score.is_blacklisted = True
         score.blacklist_reason = reason
         score.last_updated = datetime.now()
+        self._version += 1
 
         self.db.save_coin_score(score.to_dict())
         logger.info(f"Blacklisted {coin}: {reason}")
@@ -225,6 +269,7 @@ class KnowledgeBrain:
             score.is_blacklisted = False
             score.blacklist_reason = ""
             score.last_updated = datetime.now()
+            self._version += 1
 
             self.db.save_coin_score(score.to_dict())
             logger.info(f"Unblacklisted {coin}")
@@ -246,6 +291,7 @@ class KnowledgeBrain:
         # Mark as improving trend (the closest we have to "favored" status)
         score.trend = "improving"
         score.last_updated = datetime.now()
+        self._version += 1
 
         self.db.save_coin_score(score.to_dict())
         logger.info(f"Favored {coin}: {reason}")
@@ -401,6 +447,20 @@ class KnowledgeBrain:
         """
         return [r for r in self._regime_rules.values() if r.is_active]
 
+    def get_rules_matching(self, prefix: str) -> List[RegimeRule]:
+        """Get active regime rules whose ID starts with a prefix.
+
+        Args:
+            prefix: Rule ID prefix (e.g., "time_filter").
+
+        Returns:
+            List of matching active RegimeRule objects.
+        """
+        return [
+            r for r in self._regime_rules.values()
+            if r.is_active and r.rule_id.startswith(prefix)
+        ]
+
     def add_rule(self, rule: RegimeRule) -> None:
         """Add a new regime rule.
 
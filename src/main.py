@@ -19,12 +19,13 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, TYPE_CHECKING
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.market_feed import MarketFeed, PriceTick
+from src.health_monitor import HealthMonitor, aggregate_health
 from src.sniper import Sniper
 from src.journal import TradeJournal
 from src.models.trade_condition import TradeCondition
@@ -39,18 +40,21 @@ from src.reflection import ReflectionEngine
 from src.adaptation import AdaptationEngine
 from src.profitability import ProfitabilityTracker, SnapshotScheduler, TimeFrame
 from src.effectiveness import EffectivenessMonitor
-from src.dashboard_v2 import DashboardServer
 
 # Phase 3: Technical Analysis + Market Sentiment
 from src.technical.candle_fetcher import CandleFetcher
 from src.technical.manager import TechnicalManager
 from src.sentiment.context_manager import ContextManager
 
+if TYPE_CHECKING:
+    # Imported lazily in main(): FastAPI/pydantic are only needed with --dashboard
+    from src.dashboard_v2 import DashboardServer
+
 # Import settings
 try:
     from config.settings import (
         TRADEABLE_COINS, DEFAULT_EXCHANGE, INITIAL_BALANCE,
-        STALE_DATA_THRESHOLD, STATUS_LOG_INTERVAL, SNIPER_STATE_PATH,
+        STATUS_LOG_INTERVAL, SNIPER_STATE_PATH,
         STRATEGIST_INTERVAL, STRATEGIST_ENABLED
     )
 except ImportError:
@@ -58,7 +62,6 @@ except ImportError:
     TRADEABLE_COINS = ["BTC", "ETH", "SOL"]
     DEFAULT_EXCHANGE = "bybit"
     INITIAL_BALANCE = 10000.0
-    STALE_DATA_THRESHOLD = 5
     STATUS_LOG_INTERVAL = 60
     SNIPER_STATE_PATH = "data/sniper_state.json"
     STRATEGIST_INTERVAL = 180  # 3 minutes
@@ -73,77 +76,6 @@ logging.basicConfig(
 logger = logging.getLogger("TradingSystem")
 
 
-class HealthMonitor:
-    """
-    Monitors system health and detects issues.
-
-    Tracks tick throughput, detects stale data, and reports system status.
-    """
-
-    def __init__(self, stale_threshold: float = STALE_DATA_THRESHOLD):
-        self.stale_threshold = stale_threshold
-        self.last_tick_time: Optional[float] = None
-        self.tick_count: int = 0
-        self.error_count: int = 0
-        self.start_time: float = time.time()
-        self._last_prices: dict[str, float] = {}
-
-    def on_tick(self, tick: PriceTick) -> None:
-        """Called on each price tick."""
-        self.last_tick_time = time.time()
-        self.tick_count += 1
-        self._last_prices[tick.coin] = tick.price
-
-    def on_error(self, error: Exception) -> None:
-        """Called when an error occurs."""
-        self.error_count += 1
-        logger.error(f"System error: {error}")
-
-    @property
-    def is_healthy(self) -> bool:
-        """Check if system is healthy (receiving data)."""
-        if self.last_tick_time is None:
-            return False
-        return time.time() - self.last_tick_time < self.stale_threshold
-
-    @property
-    def is_feed_stale(self) -> bool:
-        """Check if feed data is stale."""
-        if self.last_tick_time is None:
-            return True
-        return time.time() - self.last_tick_time >= self.stale_threshold
-
-    @property
-    def uptime_seconds(self) -> float:
-        """Get system uptime in seconds."""
-        return time.time() - self.start_time
-
-    @property
-    def ticks_per_second(self) -> float:
-        """Calculate average ticks per second."""
-        uptime = self.uptime_seconds
-        if uptime <= 0:
-            return 0
-        return self.tick_count / uptime
-
-    def get_stats(self) -> dict:
-        """Get health statistics."""
-        return {
-            "healthy": self.is_healthy,
-            "feed_stale": self.is_feed_stale,
-            "last_tick_time": self.last_tick_time,
-            "tick_count": self.tick_count,
-            "ticks_per_second": round(self.ticks_per_second, 2),
-            "error_count": self.error_count,
-            "uptime_seconds": round(self.uptime_seconds, 1),
-            "coins_with_prices": len(self._last_prices),
-        }
-
-    def get_last_price(self, coin: str) -> Optional[float]:
-        """Get last known price for a coin."""
-        return self._last_prices.get(coin.upper())
-
-
 class TradingSystem:
     """
     Main trading system orchestrator.
@@ -178,7 +110,7 @@ class TradingSystem:
             coins: List of coins to monitor (default: TRADEABLE_COINS)
             initial_balance: Starting paper balance
             test_mode: If True, don't connect to real exchange
-            db_path: Path to journal database (default: data/trading_bot.db)
+            db_path: Path to journal/system database (default: data/trading_bot.db)
             state_path: Path to sniper state file (default: data/sniper_state.json)
         """
         self.exchange = exchange
@@ -205,7 +137,7 @@ class TradingSystem:
         self.profitability_tracker: Optional[ProfitabilityTracker] = None
         self.snapshot_scheduler: Optional[SnapshotScheduler] = None
         self.effectiveness_monitor: Optional[EffectivenessMonitor] = None
-        self.dashboard: Optional[DashboardServer] = None
+        self.dashboard: Optional["DashboardServer"] = None
 
         # State
         self._running = False
@@ -257,9 +189,10 @@ class TradingSystem:
         logger.info("Initializing TradeJournal...")
         self.journal = TradeJournal(db_path=self._db_path, enable_async=True)
 
-        # Initialize Database (shared by multiple components)
+        # Initialize Database (shared by multiple components). On disk it is the
+        # journal's file; with ":memory:" each opens its own separate database
         logger.info("Initializing Database...")
-        self.db = Database()
+        self.db = Database(self._db_path)
 
         # Initialize Knowledge Brain, Coin Scorer, and Pattern Library
         logger.info("Initializing Knowledge Brain...")
@@ -324,7 +257,7 @@ class TradingSystem:
         # Initialize Strategist (if enabled)
         if STRATEGIST_ENABLED:
             logger.info("Initializing Strategist...")
-            self.llm = LLMInterface()
+            self.llm = LLMInterface(db=self.db)
             self.strategist = Strategist(
                 llm=self.llm,
                 market_feed=self.market_feed,
@@ -603,6 +536,22 @@ class TradingSystem:
             raise RuntimeError("System not started - call start_components() first")
         return self.sniper.add_condition(condition)
 
+    def reset(self) -> None:
+        """
+        Reset trading state between test runs (test mode).
+
+        Clears conditions and positions and restores the starting balance
+        without rebuilding components. Journal rows already written are kept.
+        """
+        if not self.sniper:
+            raise RuntimeError("System not started - call start_components() first")
+        self.sniper.active_conditions.clear()
+        self.sniper.open_positions.clear()
+        self.sniper.balance = self.initial_balance
+        self.sniper.total_pnl = 0.0
+        self.sniper.trades_executed = 0
+        self.journal.pending_entries.clear()
+
     def inject_price(self, coin: str, price: float, timestamp: int = None) -> None:
         """
         Inject a test price tick (test mode).
@@ -627,6 +576,36 @@ class TradingSystem:
         if self.health:
             self.health.on_tick(tick)
 
+    def inject_prices(self, coin: str, prices: Iterable[float], timestamp: int = None) -> None:
+        """
+        Inject a batch of test price ticks for one coin (test mode).
+
+        Equivalent to calling inject_price() for each price, but the
+        started-check, symbol normalisation, timestamp and handler lookups
+        happen once for the whole batch. A single PriceTick is reused and
+        updated in place, so handlers must not hold on to it; the sniper
+        and health monitor only read its fields.
+
+        Args:
+            coin: Coin symbol
+            prices: Price values, applied in order
+            timestamp: Optional timestamp shared by every tick (default: now)
+        """
+        if not self.sniper:
+            raise RuntimeError("System not started - call start_components() first")
+
+        coin = coin.upper()
+        ts = timestamp or int(time.time() * 1000)
+        on_price_tick = self._on_price_tick
+        on_health_tick = self.health.on_tick if self.health else None
+
+        tick = PriceTick(coin=coin, price=0.0, timestamp=ts, volume_24h=0, change_24h=0)
+        for price in prices:
+            tick.price = price
+            on_price_tick(tick)
+            if on_health_tick:
+                on_health_tick(tick)
+
     # =========================================================================
     # Status Methods
     # =========================================================================
@@ -705,22 +684,14 @@ class TradingSystem:
                 continue
 
             try:
-                component_health = component.get_health()
-                health["components"][name] = component_health
-
-                # Aggregate overall status
-                status = component_health.get("status", "unknown")
-                if status == "failed":
-                    health["overall"] = "failed"
-                elif status == "degraded" and health["overall"] == "healthy":
-                    health["overall"] = "degraded"
+                health["components"][name] = component.get_health()
             except Exception as e:
                 health["components"][name] = {
                     "status": "error",
                     "error": str(e),
                 }
-                health["overall"] = "degraded"
 
+        health["overall"] = aggregate_health(health["components"])
         return health
 
     # =========================================================================
@@ -1050,6 +1021,8 @@ async def main():
 
         # Start dashboard if requested
         if args.dashboard:
+            from src.dashboard_v2 import DashboardServer
+
             logger.info(f"Starting dashboard on http://{args.host}:{args.port}")
             system.dashboard = DashboardServer(system)
             # Run dashboard in background task
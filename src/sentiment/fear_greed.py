@@ -55,6 +55,7 @@ class FearGreedFetcher:
         self._cache_time: Optional[datetime] = None
         self._retry_count = 3
         self._retry_delay = 1  # seconds
+        self._now = datetime.now  # Clock used for cache age (overridable in tests)
 
     def get_current(self) -> Optional[FearGreedData]:
         """Get current Fear & Greed value.
@@ -72,7 +73,7 @@ class FearGreedFetcher:
                 data = self._fetch_from_api()
                 if data:
                     self._cached_data = data
-                    self._cache_time = datetime.now()
+                    self._cache_time = self._now()
                     return data
             except Exception as e:
                 logger.warning(f"Fear & Greed API attempt {attempt + 1} failed: {e}")
@@ -140,12 +141,12 @@ class FearGreedFetcher:
         if self._cached_data is None or self._cache_time is None:
             return False
 
-        age = datetime.now() - self._cache_time
+        age = self._now() - self._cache_time
         if age > self.cache_ttl:
             return False
 
         # Warn if data is >24 hours old (stale)
-        data_age = datetime.now() - self._cached_data.timestamp
+        data_age = self._now() - self._cached_data.timestamp
         if data_age > timedelta(hours=24):
             logger.warning(f"Fear & Greed data is {data_age.total_seconds()/3600:.1f}h old")
 
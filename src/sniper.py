@@ -136,6 +136,10 @@ class Sniper:
         self.active_conditions: dict[str, TradeCondition] = {}
         self.open_positions: dict[str, Position] = {}
 
+        # Earliest valid_until among active conditions, as Unix seconds.
+        # 0.0 means unknown and forces the next expiry scan.
+        self._next_expiry = 0.0
+
         # Tracking
         self.total_pnl = 0.0
         self.trades_executed = 0
@@ -170,6 +174,7 @@ class Sniper:
             c.id: c for c in conditions
             if c.valid_until > now
         }
+        self._next_expiry = 0.0
 
         logger.info(f"Set {len(self.active_conditions)} active conditions")
         return len(self.active_conditions)
@@ -192,6 +197,7 @@ class Sniper:
             logger.debug(f"Condition {condition.id} already exists, updating")
 
         self.active_conditions[condition.id] = condition
+        self._next_expiry = 0.0
         logger.info(
             f"Added condition: {condition.direction} {condition.coin} "
             f"{'>' if condition.trigger_condition == 'ABOVE' else '<'} "
@@ -277,10 +283,12 @@ class Sniper:
         self._cleanup_expired_conditions()
 
         # Check entry conditions for this coin
-        self._check_entry_conditions(coin, price, timestamp)
+        if self.active_conditions:
+            self._check_entry_conditions(coin, price, timestamp)
 
         # Check exit conditions for open positions
-        self._check_exit_conditions(coin, price, timestamp)
+        if self.open_positions:
+            self._check_exit_conditions(coin, price, timestamp)
 
         # Track performance
         elapsed = time.perf_counter() - start
@@ -288,7 +296,14 @@ class Sniper:
         self._total_tick_time += elapsed
 
     def _cleanup_expired_conditions(self) -> None:
-        """Remove expired conditions. Called on each tick."""
+        """
+        Remove expired conditions. Called on each tick.
+
+        Conditions are only scanned once the earliest known expiry has
+        passed; until then a tick costs one float comparison.
+        """
+        if not self.active_conditions or time.time() < self._next_expiry:
+            return
         now = datetime.now()
         expired = [
             cid for cid, c in self.active_conditions.items()
@@ -298,6 +313,11 @@ class Sniper:
             logger.debug(f"Condition {cid} expired")
             del self.active_conditions[cid]
 
+        if self.active_conditions:
+            self._next_expiry = min(
+                c.valid_until for c in self.active_conditions.values()
+            ).timestamp()
+
     # =========================================================================
     # Entry Logic
     # =========================================================================
@@ -816,6 +836,7 @@ class Sniper:
                 condition = TradeCondition.from_dict(c_dict)
                 if not condition.is_expired():
                     self.active_conditions[condition.id] = condition
+            self._next_expiry = 0.0
 
             # Load positions
             self.open_positions = {}
@@ -0,0 +1,19 @@
+"""Shared pytest configuration for the test suite."""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``wallclock`` tests when running under pytest-xdist.
+
+    Wall-clock budgets are unreliable while xdist workers compete for CPU;
+    run them serially (plain ``pytest``) to check them.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return
+    skip = pytest.mark.skip(reason="timing assertions are flaky under pytest-xdist")
+    for item in items:
+        if "wallclock" in item.keywords:
+            item.add_marker(skip)
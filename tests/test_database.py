@@ -1,33 +1,53 @@
 """Tests for the database module."""
 
-import os
+import shutil
+import sqlite3
 import tempfile
+from pathlib import Path
+
 import pytest
 from src.database import Database
 
 
+@pytest.fixture(scope="module")
+def template_db_path(tmp_path_factory):
+    """Build the schema and seed rows once; tests clone this file."""
+    path = tmp_path_factory.mktemp("template") / "template.db"
+    Database(db_path=str(path))
+    return path
+
+
+def clone_database(template_path: Path, dest_path: Path) -> None:
+    """Copy a SQLite database page-by-page using the backup API."""
+    src = sqlite3.connect(str(template_path))
+    dest = sqlite3.connect(str(dest_path))
+    try:
+        src.backup(dest)
+    finally:
+        dest.close()
+        src.close()
+
+
 class TestDatabase:
     """Test cases for the Database class."""
 
-    def setup_method(self):
-        """Create a temporary database for each test."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_trading_bot.db")
+    @pytest.fixture(autouse=True)
+    def temp_database(self, template_db_path):
+        """Clone the template database into a fresh temp dir for each test."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = str(self.temp_dir / "test_trading_bot.db")
+        clone_database(template_db_path, Path(self.db_path))
+        # Schema already exists, so CREATE ... IF NOT EXISTS is a no-op
         self.db = Database(db_path=self.db_path)
-
-    def teardown_method(self):
-        """Clean up temporary database after each test."""
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        yield
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_database_creation(self):
         """Test that database file is created."""
-        assert os.path.exists(self.db_path)
+        assert Path(self.db_path).exists()
 
     def test_tables_exist(self):
         """Test that all required tables are created."""
-        import sqlite3
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -87,7 +107,6 @@ class TestDatabase:
 
     def test_indexes_created(self):
         """Test that indexes are created for performance."""
-        import sqlite3
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
@@ -107,6 +126,30 @@ class TestDatabase:
         assert expected_indexes.issubset(indexes)
 
 
+def test_in_memory_database_persists_across_connections():
+    """Test that ':memory:' keeps data between per-call connections."""
+    db = Database(":memory:")
+    db.log_activity('trade', 'Opened BTC position')
+
+    assert db.get_account_state()['balance'] == 1000.0
+    assert len(db.get_recent_activity()) == 1
+    # Separate instances must not share state
+    assert Database(":memory:").get_recent_activity() == []
+
+
+def test_clone_copies_contents_independently():
+    """Test that clone() returns an in-memory copy that does not share writes."""
+    template = Database(":memory:")
+    template.log_activity('trade', 'Opened BTC position')
+
+    copy = template.clone()
+    copy.log_activity('trade', 'Opened ETH position')
+
+    assert copy.get_account_state()['balance'] == 1000.0
+    assert len(copy.get_recent_activity()) == 2
+    assert len(template.get_recent_activity()) == 1
+
+
 def test_database_import():
     """Test that Database can be imported."""
     from src.database import Database
@@ -4,15 +4,13 @@ Tests for EffectivenessMonitor (TASK-142).
 Tests effectiveness measurement, rating calculation, and rollback functionality.
 """
 
-import os
-import sys
-import tempfile
-import unittest
+import bisect
+import dataclasses
+from collections import namedtuple
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from src.database import Database
 from src.knowledge import KnowledgeBrain
@@ -20,6 +18,7 @@ from src.effectiveness import (
     EffectivenessMonitor,
     EffectivenessRating,
     EffectivenessResult,
+    _score_change,
 )
 
 
@@ -31,24 +30,31 @@ class MockJournalEntry:
         id: str,
         coin: str,
         pnl_usd: float,
+        exit_time: datetime,
         position_size_usd: float = 100.0,
-        exit_time: datetime = None,
     ):
         self.id = id
         self.coin = coin
         self.pnl_usd = pnl_usd
         self.position_size_usd = position_size_usd
-        self.exit_time = exit_time or datetime.now()
+        self.exit_time = exit_time
 
 
 class MockJournal:
-    """Mock journal for testing."""
+    """Mock journal for testing.
+
+    Keeps trades sorted by exit_time so get_closed_after can bisect to the
+    cutoff instead of scanning every trade.
+    """
 
     def __init__(self, trades=None):
-        self.trades = trades or []
+        self.trades = sorted(trades or [], key=lambda t: t.exit_time)
+        self._exit_times_sorted = [t.exit_time for t in self.trades]
 
-    def get_recent(self, hours=24, status=None, limit=10000):
-        return self.trades
+    def get_closed_after(self, since, limit=10000):
+        # Newest first, matching TradeJournal.get_closed_after
+        i = bisect.bisect_right(self._exit_times_sorted, since)
+        return self.trades[i:][::-1][:limit]
 
 
 class MockProfitability:
@@ -67,9 +73,14 @@ class MockProfitability:
                 "profit_factor": 0.0,
             }
 
-        wins = sum(1 for t in trades if t.pnl_usd > 0)
+        # Single pass over P&L values for both wins and total P&L
+        wins = 0
+        pnl = 0.0
+        for value in (t.pnl_usd for t in trades):
+            pnl += value
+            if value > 0:
+                wins += 1
         total = len(trades)
-        pnl = sum(t.pnl_usd for t in trades)
 
         return {
             "total_trades": total,
@@ -80,159 +91,165 @@ class MockProfitability:
         }
 
 
-class TestEffectivenessRating(unittest.TestCase):
-    """Test effectiveness rating calculation."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-        self.knowledge = KnowledgeBrain(self.db)
-        self.journal = MockJournal()
-        self.profitability = MockProfitability()
-
-        self.monitor = EffectivenessMonitor(
-            db=self.db,
-            journal=self.journal,
-            profitability=self.profitability,
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
-        )
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_highly_effective_rating(self):
-        """Test highly effective rating when win rate improves significantly."""
-        pre_metrics = {"overall": {"win_rate": 40.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 55.0, "total_pnl": 100.0, "profit_factor": 2.0}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test1",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,
-        )
-
-        self.assertEqual(result.rating, EffectivenessRating.HIGHLY_EFFECTIVE)
-        self.assertEqual(result.win_rate_change, 15.0)
-        self.assertFalse(result.should_rollback)
-
-    def test_effective_rating(self):
-        """Test effective rating for moderate improvement."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 55.0, "total_pnl": 50.0, "profit_factor": 1.5}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test2",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,
-        )
-
-        self.assertEqual(result.rating, EffectivenessRating.EFFECTIVE)
-        self.assertEqual(result.win_rate_change, 5.0)
-
-    def test_neutral_rating(self):
-        """Test neutral rating when no significant change."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 51.0, "total_pnl": 10.0, "profit_factor": 1.1}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test3",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,
-        )
-
-        self.assertEqual(result.rating, EffectivenessRating.NEUTRAL)
-
-    def test_ineffective_rating(self):
-        """Test ineffective rating for moderate decline."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 44.0, "total_pnl": -15.0, "profit_factor": 0.8}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test4",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,
-        )
-
-        self.assertEqual(result.rating, EffectivenessRating.INEFFECTIVE)
-
-    def test_harmful_rating(self):
-        """Test harmful rating for significant decline."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 35.0, "total_pnl": -50.0, "profit_factor": 0.5}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test5",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,
-        )
-
-        self.assertEqual(result.rating, EffectivenessRating.HARMFUL)
-        self.assertEqual(result.win_rate_change, -15.0)
-
-    def test_harmful_triggers_rollback(self):
-        """Test that harmful rating with significant loss triggers rollback."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 35.0, "total_pnl": -50.0, "profit_factor": 0.5}}
-
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test6",
-            pre_metrics=pre_metrics,
-            post_metrics=post_metrics,
-            hours_elapsed=48,
-            trades_measured=15,  # Enough trades
-        )
+EffectivenessStack = namedtuple(
+    "EffectivenessStack", "monitor db knowledge journal profitability"
+)
 
-        self.assertTrue(result.should_rollback)
-        self.assertIsNotNone(result.rollback_reason)
-        self.assertIn("15.0%", result.rollback_reason)
+# Tables tests may write to; cleared after each test using the shared DB
+MUTABLE_TABLES = ("adaptations", "coin_scores", "regime_rules", "activity_log")
+
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """One in-memory Database per module; schema creation dominates setup."""
+    return Database(":memory:")
+
+
+@pytest.fixture
+def effectiveness_stack(shared_db):
+    """Fully wired EffectivenessMonitor plus handles to its dependencies.
+
+    The database is shared across the module, so rows written by the test
+    are deleted on teardown. KnowledgeBrain is rebuilt per test so its
+    in-memory caches start empty.
+    """
+    knowledge = KnowledgeBrain(shared_db)
+    journal = MockJournal()
+    profitability = MockProfitability()
+    monitor = EffectivenessMonitor(
+        db=shared_db,
+        journal=journal,
+        profitability=profitability,
+        adaptation_engine=SimpleNamespace(),
+        knowledge=knowledge,
+    )
+    yield EffectivenessStack(monitor, shared_db, knowledge, journal, profitability)
+
+    with shared_db._get_connection() as conn:
+        for table in MUTABLE_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+
+
+@pytest.fixture(scope="module")
+def rating_monitor(shared_db):
+    """One EffectivenessMonitor shared by every rating case in the module.
+
+    Safe only because _calculate_effectiveness has no side effects: it never
+    touches the database, journal or monitor stats. Tests that mutate state
+    must use effectiveness_stack instead.
+    """
+    return EffectivenessMonitor(
+        db=shared_db,
+        journal=MockJournal(),
+        profitability=MockProfitability(),
+        adaptation_engine=SimpleNamespace(),
+        knowledge=KnowledgeBrain(shared_db),
+    )
+
+
+class TestEffectivenessRating:
+    """Test effectiveness rating calculation."""
 
-    def test_harmful_no_rollback_insufficient_trades(self):
-        """Test that harmful rating doesn't trigger rollback with few trades."""
-        pre_metrics = {"overall": {"win_rate": 50.0, "total_pnl": 0.0, "profit_factor": 1.0}}
-        post_metrics = {"overall": {"win_rate": 35.0, "total_pnl": -50.0, "profit_factor": 0.5}}
+    @pytest.mark.parametrize(
+        "pre_wr,post_wr,post_pnl,post_pf,trades,"
+        "expected_rating,expected_wrc,expected_rollback,expected_reason",
+        [
+            # Win rate improves significantly
+            (40.0, 55.0, 100.0, 2.0, 15,
+             EffectivenessRating.HIGHLY_EFFECTIVE, 15.0, False, None),
+            # Moderate improvement
+            (50.0, 55.0, 50.0, 1.5, 15,
+             EffectivenessRating.EFFECTIVE, 5.0, False, None),
+            # No significant change
+            (50.0, 51.0, 10.0, 1.1, 15,
+             EffectivenessRating.NEUTRAL, 1.0, False, None),
+            # Moderate decline
+            (50.0, 44.0, -15.0, 0.8, 15,
+             EffectivenessRating.INEFFECTIVE, -6.0, False, None),
+            # Significant decline with enough trades triggers rollback
+            (50.0, 35.0, -50.0, 0.5, 15,
+             EffectivenessRating.HARMFUL, -15.0, True, "15.0%"),
+            # Significant decline but too few trades to roll back
+            (50.0, 35.0, -50.0, 0.5, 5,
+             EffectivenessRating.HARMFUL, -15.0, False, None),
+        ],
+        ids=[
+            "highly_effective",
+            "effective",
+            "neutral",
+            "ineffective",
+            "harmful_triggers_rollback",
+            "harmful_insufficient_trades",
+        ],
+    )
+    def test_rating(
+        self, rating_monitor, pre_wr, post_wr, post_pnl, post_pf, trades,
+        expected_rating, expected_wrc, expected_rollback, expected_reason,
+    ):
+        """Test rating, win rate change and rollback recommendation."""
+        pre_metrics = {"overall": {"win_rate": pre_wr, "total_pnl": 0.0, "profit_factor": 1.0}}
+        post_metrics = {"overall": {"win_rate": post_wr, "total_pnl": post_pnl, "profit_factor": post_pf}}
 
-        result = self.monitor._calculate_effectiveness(
-            adaptation_id="test7",
+        result = rating_monitor._calculate_effectiveness(
+            adaptation_id="test_rating",
             pre_metrics=pre_metrics,
             post_metrics=post_metrics,
             hours_elapsed=48,
-            trades_measured=5,  # Not enough trades
+            trades_measured=trades,
         )
 
-        self.assertEqual(result.rating, EffectivenessRating.HARMFUL)
-        self.assertFalse(result.should_rollback)
-
-
-class TestPostMetricsCapture(unittest.TestCase):
+        assert result.rating == expected_rating
+        assert result.win_rate_change == expected_wrc
+        assert result.should_rollback is expected_rollback
+        if expected_reason is None:
+            assert result.rollback_reason is None
+        else:
+            assert expected_reason in result.rollback_reason
+
+    # EffectivenessMonitor's thresholds, in _score_change order
+    DEFAULT_THRESHOLDS = (
+        EffectivenessMonitor.HIGHLY_EFFECTIVE_THRESHOLD,
+        EffectivenessMonitor.EFFECTIVE_THRESHOLD,
+        EffectivenessMonitor.INEFFECTIVE_THRESHOLD,
+        EffectivenessMonitor.HARMFUL_THRESHOLD,
+        EffectivenessMonitor.ROLLBACK_MIN_PNL_LOSS,
+        EffectivenessMonitor.ROLLBACK_MIN_TRADES,
+    )
+
+    def test_score_change_cached_matches_fresh(self):
+        """A memoized rating equals an uncached computation of the same inputs."""
+        args = (50.0, 35.0, 0.0, -50.0, 1.0, 0.5, 15, self.DEFAULT_THRESHOLDS)
+        _score_change.cache_clear()
+
+        first = _score_change(*args)
+        cached = _score_change(*args)
+
+        assert _score_change.cache_info().hits == 1
+        assert cached == first == _score_change.__wrapped__(*args)
+        assert cached[0] == EffectivenessRating.HARMFUL
+
+    def test_score_change_thresholds_not_shared(self):
+        """Different thresholds are separate cache entries with their own rating."""
+        metrics = (50.0, 55.0, 0.0, 50.0, 1.0, 1.5, 15)
+        strict = (10.0, 8.0) + self.DEFAULT_THRESHOLDS[2:]  # Effective needs +8%
+        _score_change.cache_clear()
+
+        default_rating = _score_change(*metrics, self.DEFAULT_THRESHOLDS)[0]
+        strict_rating = _score_change(*metrics, strict)[0]
+
+        assert default_rating == EffectivenessRating.EFFECTIVE
+        assert strict_rating == EffectivenessRating.NEUTRAL
+        assert _score_change.cache_info().hits == 0
+        assert _score_change.cache_info().currsize == 2
+
+
+class TestPostMetricsCapture:
     """Test post-metrics capture."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-        self.knowledge = KnowledgeBrain(self.db)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_capture_post_metrics_filters_by_time(self):
+    def test_capture_post_metrics_filters_by_time(self, effectiveness_stack):
         """Test that post-metrics only include trades after adaptation."""
+        # Single clock read; every entry time is derived from it
         adaptation_time = datetime.now() - timedelta(hours=48)
 
         # Trades before adaptation (should be excluded)
@@ -247,55 +264,29 @@ class TestPostMetricsCapture(unittest.TestCase):
             MockJournalEntry("t4", "DOGE", pnl_usd=15.0, exit_time=adaptation_time + timedelta(hours=2)),
         ]
 
-        journal = MockJournal(old_trades + new_trades)
-        profitability = MockProfitability()
-
-        monitor = EffectivenessMonitor(
-            db=self.db,
-            journal=journal,
-            profitability=profitability,
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
-        )
+        monitor = effectiveness_stack.monitor
+        monitor.journal = MockJournal(old_trades + new_trades)
 
         post_metrics = monitor._capture_post_metrics(adaptation_time)
 
         # Should only count the 2 new trades
-        self.assertEqual(post_metrics["trades_measured"], 2)
+        assert post_metrics["trades_measured"] == 2
+        assert post_metrics["overall"]["total_pnl"] == 35.0
 
 
-class TestRollbackFunctionality(unittest.TestCase):
+class TestRollbackFunctionality:
     """Test rollback functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-        self.knowledge = KnowledgeBrain(self.db)
-        self.journal = MockJournal()
-        self.profitability = MockProfitability()
-
-        self.monitor = EffectivenessMonitor(
-            db=self.db,
-            journal=self.journal,
-            profitability=self.profitability,
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
-        )
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_rollback_blacklist(self):
+    def test_rollback_blacklist(self, effectiveness_stack):
         """Test rollback of coin blacklist."""
+        monitor, db, knowledge = effectiveness_stack[:3]
+
         # Blacklist a coin
-        self.knowledge.blacklist_coin("DOGE", "Testing")
-        self.assertTrue(self.knowledge.is_blacklisted("DOGE"))
+        knowledge.blacklist_coin("DOGE", "Testing")
+        assert knowledge.is_blacklisted("DOGE")
 
         # Log an adaptation
-        self.db.log_adaptation(
+        db.log_adaptation(
             adaptation_id="test_blacklist",
             insight_type="coin",
             action="blacklist",
@@ -304,15 +295,17 @@ class TestRollbackFunctionality(unittest.TestCase):
         )
 
         # Execute rollback
-        success = self.monitor.execute_rollback("test_blacklist")
+        success = monitor.execute_rollback("test_blacklist")
 
-        self.assertTrue(success)
-        self.assertFalse(self.knowledge.is_blacklisted("DOGE"))
+        assert success
+        assert not knowledge.is_blacklisted("DOGE")
 
-    def test_rollback_time_rule(self):
+    def test_rollback_time_rule(self, effectiveness_stack):
         """Test rollback of time rule."""
         from src.models.knowledge import RegimeRule
 
+        monitor, db, knowledge = effectiveness_stack[:3]
+
         # Create a time rule
         rule = RegimeRule(
             rule_id="time_filter_test",
@@ -320,14 +313,14 @@ class TestRollbackFunctionality(unittest.TestCase):
             condition={"hour_of_day": {"op": "in", "value": [2, 3, 4]}},
             action="REDUCE_SIZE",
         )
-        self.knowledge.add_rule(rule)
+        knowledge.add_rule(rule)
 
         # Verify rule is active
-        active_rules = self.knowledge.get_active_rules()
-        self.assertTrue(any(r.rule_id == "time_filter_test" for r in active_rules))
+        active_rules = knowledge.get_active_rules()
+        assert any(r.rule_id == "time_filter_test" for r in active_rules)
 
         # Log an adaptation
-        self.db.log_adaptation(
+        db.log_adaptation(
             adaptation_id="test_time_rule",
             insight_type="time",
             action="create_time_rule",
@@ -336,18 +329,18 @@ class TestRollbackFunctionality(unittest.TestCase):
         )
 
         # Execute rollback
-        success = self.monitor.execute_rollback("test_time_rule")
+        success = monitor.execute_rollback("test_time_rule")
 
-        self.assertTrue(success)
+        assert success
 
         # Verify rule is deactivated
-        active_rules = self.knowledge.get_active_rules()
-        self.assertFalse(any(r.rule_id == "time_filter_test" for r in active_rules))
+        active_rules = knowledge.get_active_rules()
+        assert not any(r.rule_id == "time_filter_test" for r in active_rules)
 
-    def test_suggest_rollback(self):
+    def test_suggest_rollback(self, effectiveness_stack):
         """Test rollback suggestion."""
         # Log an adaptation
-        self.db.log_adaptation(
+        effectiveness_stack.db.log_adaptation(
             adaptation_id="test_suggest",
             insight_type="coin",
             action="blacklist",
@@ -355,119 +348,79 @@ class TestRollbackFunctionality(unittest.TestCase):
             description="Blacklisted XRP",
         )
 
-        suggestion = self.monitor.suggest_rollback("test_suggest")
+        suggestion = effectiveness_stack.monitor.suggest_rollback("test_suggest")
 
-        self.assertEqual(suggestion["adaptation_id"], "test_suggest")
-        self.assertEqual(suggestion["target"], "XRP")
-        self.assertTrue(suggestion["can_rollback"])
-        self.assertIn("Unblacklist", suggestion["rollback_action"])
+        assert suggestion["adaptation_id"] == "test_suggest"
+        assert suggestion["target"] == "XRP"
+        assert suggestion["can_rollback"]
+        assert "Unblacklist" in suggestion["rollback_action"]
 
 
-class TestEffectivenessSummary(unittest.TestCase):
+class TestEffectivenessSummary:
     """Test effectiveness summary."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-        self.knowledge = KnowledgeBrain(self.db)
-        self.journal = MockJournal()
-        self.profitability = MockProfitability()
-
-        self.monitor = EffectivenessMonitor(
-            db=self.db,
-            journal=self.journal,
-            profitability=self.profitability,
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
-        )
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_empty_summary(self):
+    def test_empty_summary(self, effectiveness_stack):
         """Test summary with no adaptations."""
-        summary = self.monitor.get_effectiveness_summary()
+        summary = effectiveness_stack.monitor.get_effectiveness_summary()
 
-        self.assertEqual(summary["total"], 0)
-        self.assertEqual(summary["total_measured"], 0)
-        self.assertEqual(summary["pending"], 0)
+        assert summary["total"] == 0
+        assert summary["total_measured"] == 0
+        assert summary["pending"] == 0
 
-    def test_summary_counts(self):
+    def test_summary_counts(self, effectiveness_stack):
         """Test summary counts adaptations correctly."""
-        # Log some adaptations
-        self.db.log_adaptation(
-            adaptation_id="adapt1",
-            insight_type="coin",
-            action="blacklist",
-            target="COIN1",
-            description="Test 1",
-        )
-        self.db.log_adaptation(
-            adaptation_id="adapt2",
-            insight_type="coin",
-            action="blacklist",
-            target="COIN2",
-            description="Test 2",
-        )
-
-        summary = self.monitor.get_effectiveness_summary()
-
-        self.assertEqual(summary["total"], 2)
-        self.assertEqual(summary["pending"], 2)  # Not measured yet
-
-
-class TestHealthCheck(unittest.TestCase):
+        # Log some adaptations in one transaction
+        effectiveness_stack.db.log_adaptations([
+            {
+                "adaptation_id": "adapt1",
+                "insight_type": "coin",
+                "action": "blacklist",
+                "target": "COIN1",
+                "description": "Test 1",
+            },
+            {
+                "adaptation_id": "adapt2",
+                "insight_type": "coin",
+                "action": "blacklist",
+                "target": "COIN2",
+                "description": "Test 2",
+            },
+        ])
+
+        summary = effectiveness_stack.monitor.get_effectiveness_summary()
+
+        assert summary["total"] == 2
+        assert summary["pending"] == 2  # Not measured yet
+
+
+class TestHealthCheck:
     """Test health check functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-        self.knowledge = KnowledgeBrain(self.db)
-        self.journal = MockJournal()
-        self.profitability = MockProfitability()
-
-        self.monitor = EffectivenessMonitor(
-            db=self.db,
-            journal=self.journal,
-            profitability=self.profitability,
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
-        )
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
-    def test_health_check_healthy(self):
+    def test_health_check_healthy(self, effectiveness_stack):
         """Test health check returns healthy status."""
-        health = self.monitor.get_health()
+        health = effectiveness_stack.monitor.get_health()
 
-        self.assertEqual(health["status"], "healthy")
-        self.assertIn("metrics", health)
-        self.assertTrue(health["metrics"]["has_journal"])
-        self.assertTrue(health["metrics"]["has_profitability"])
+        assert health["status"] == "healthy"
+        assert "metrics" in health
+        assert health["metrics"]["has_journal"]
+        assert health["metrics"]["has_profitability"]
 
-    def test_health_check_degraded(self):
+    def test_health_check_degraded(self, effectiveness_stack):
         """Test health check returns degraded when dependencies missing."""
         monitor = EffectivenessMonitor(
-            db=self.db,
+            db=effectiveness_stack.db,
             journal=None,  # Missing
             profitability=None,  # Missing
-            adaptation_engine=MagicMock(),
-            knowledge=self.knowledge,
+            adaptation_engine=SimpleNamespace(),
+            knowledge=effectiveness_stack.knowledge,
         )
 
         health = monitor.get_health()
 
-        self.assertEqual(health["status"], "degraded")
+        assert health["status"] == "degraded"
 
 
-class TestEffectivenessResultSerialization(unittest.TestCase):
+class TestEffectivenessResultSerialization:
     """Test EffectivenessResult serialization."""
 
     def test_to_dict(self):
@@ -488,12 +441,37 @@ class TestEffectivenessResultSerialization(unittest.TestCase):
 
         d = result.to_dict()
 
-        self.assertEqual(d["adaptation_id"], "test123")
-        self.assertEqual(d["rating"], "effective")
-        self.assertEqual(d["win_rate_change"], 5.0)
-        self.assertEqual(d["trades_measured"], 15)
-        self.assertFalse(d["should_rollback"])
+        assert d["adaptation_id"] == "test123"
+        assert d["rating"] == "effective"
+        assert d["win_rate_change"] == 5.0
+        assert d["trades_measured"] == 15
+        assert not d["should_rollback"]
+
+    @pytest.mark.parametrize("rating", list(EffectivenessRating))
+    def test_to_dict_rating_is_enum_value(self, rating):
+        """Test to_dict emits the enum's string value unchanged."""
+        result = EffectivenessResult(
+            adaptation_id="test123",
+            rating=rating,
+            pre_metrics={},
+            post_metrics={},
+        )
+
+        assert result.to_dict()["rating"] is rating.value
+
+    def test_result_is_immutable(self):
+        """Test EffectivenessResult is frozen and slotted."""
+        result = EffectivenessResult(
+            adaptation_id="test123",
+            rating=EffectivenessRating.NEUTRAL,
+            pre_metrics={},
+            post_metrics={},
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.rating = EffectivenessRating.HARMFUL
+        assert not hasattr(result, "__dict__")
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
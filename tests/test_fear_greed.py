@@ -1,44 +1,66 @@
 """Tests for Fear & Greed Index fetcher."""
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 from src.sentiment.fear_greed import FearGreedFetcher, FearGreedData
 
+# Fixed timestamp for dataclass construction and as the base of the fake clock.
+_TS = datetime(2024, 1, 1, 12, 0, 0)
 
-class TestFearGreedData:
-    """Tests for FearGreedData dataclass."""
+# Canned Alternative.me responses shared across tests (never mutated).
+_FEAR_PAYLOAD = {"data": [{"value": "25", "value_classification": "Fear", "timestamp": "1706918400"}]}
+_NEUTRAL_PAYLOAD = {"data": [{"value": "50", "value_classification": "Neutral", "timestamp": "1706918400"}]}
+_FEAR_30_PAYLOAD = {"data": [{"value": "30", "value_classification": "Fear", "timestamp": "1706918400"}]}
+_HISTORY_PAYLOAD = {"data": [
+    {"value": "50", "value_classification": "Neutral", "timestamp": "1706918400"},
+    {"value": "45", "value_classification": "Fear", "timestamp": "1706832000"},
+    {"value": "40", "value_classification": "Fear", "timestamp": "1706745600"},
+]}
+
+
+class _FakeResp:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload):
+        self._payload = payload
 
-    def test_extreme_fear_boundary(self):
-        """Test extreme fear at boundary (24 = extreme, 25 = not)."""
-        extreme = FearGreedData(value=24, classification="Extreme Fear", timestamp=datetime.now())
-        not_extreme = FearGreedData(value=25, classification="Fear", timestamp=datetime.now())
+    def json(self):
+        return self._payload
 
-        assert extreme.is_extreme_fear is True
-        assert not_extreme.is_extreme_fear is False
+    def raise_for_status(self):
+        pass
 
-    def test_extreme_greed_boundary(self):
-        """Test extreme greed at boundary (75 = not extreme, 76 = extreme)."""
-        not_extreme = FearGreedData(value=75, classification="Greed", timestamp=datetime.now())
-        extreme = FearGreedData(value=76, classification="Extreme Greed", timestamp=datetime.now())
 
-        assert not_extreme.is_extreme_greed is False
-        assert extreme.is_extreme_greed is True
+class TestFearGreedData:
+    """Tests for FearGreedData dataclass."""
+
+    @pytest.mark.parametrize("value,classification,expected_fear,expected_greed", [
+        (24, "Extreme Fear", True, False),
+        (25, "Fear", False, False),
+        (50, "Neutral", False, False),
+        (75, "Greed", False, False),
+        (76, "Extreme Greed", False, True),
+    ])
+    def test_extreme_flags(self, value, classification, expected_fear, expected_greed):
+        """Extreme fear is below 25 and extreme greed above 75."""
+        data = FearGreedData(value=value, classification=classification, timestamp=_TS)
 
-    def test_neutral_values(self):
-        """Test neutral values are neither extreme."""
-        neutral = FearGreedData(value=50, classification="Neutral", timestamp=datetime.now())
+        assert data.is_extreme_fear is expected_fear
+        assert data.is_extreme_greed is expected_greed
 
-        assert neutral.is_extreme_fear is False
-        assert neutral.is_extreme_greed is False
+
+@pytest.fixture(scope="module")
+def default_fetcher():
+    """Shared default-configured fetcher for tests that only read attributes."""
+    return FearGreedFetcher()
 
 
 class TestFearGreedFetcher:
     """Tests for FearGreedFetcher."""
 
-    def test_init_default_ttl(self):
-        fetcher = FearGreedFetcher()
-        assert fetcher.cache_ttl == timedelta(minutes=60)
+    def test_init_default_ttl(self, default_fetcher):
+        assert default_fetcher.cache_ttl == timedelta(minutes=60)
 
     def test_init_custom_ttl(self):
         fetcher = FearGreedFetcher(cache_ttl_minutes=30)
@@ -47,16 +69,7 @@ class TestFearGreedFetcher:
     @patch('src.sentiment.fear_greed.requests.get')
     def test_get_current_success(self, mock_get):
         """Test successful API fetch."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [{
-                "value": "25",
-                "value_classification": "Fear",
-                "timestamp": "1706918400"
-            }]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(_FEAR_PAYLOAD)
 
         fetcher = FearGreedFetcher()
         data = fetcher.get_current()
@@ -68,12 +81,7 @@ class TestFearGreedFetcher:
     @patch('src.sentiment.fear_greed.requests.get')
     def test_get_current_uses_cache(self, mock_get):
         """Test that second call uses cache."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [{"value": "50", "value_classification": "Neutral", "timestamp": "1706918400"}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(_NEUTRAL_PAYLOAD)
 
         fetcher = FearGreedFetcher()
 
@@ -89,21 +97,17 @@ class TestFearGreedFetcher:
     @patch('src.sentiment.fear_greed.requests.get')
     def test_get_current_cache_expired(self, mock_get):
         """Test that expired cache triggers new fetch."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [{"value": "50", "value_classification": "Neutral", "timestamp": "1706918400"}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(_NEUTRAL_PAYLOAD)
 
         fetcher = FearGreedFetcher(cache_ttl_minutes=1)
+        fetcher._now = lambda: _TS
 
         # First call
         fetcher.get_current()
         assert mock_get.call_count == 1
 
-        # Expire cache
-        fetcher._cache_time = datetime.now() - timedelta(minutes=5)
+        # Advance the clock past the TTL
+        fetcher._now = lambda: _TS + timedelta(minutes=5)
 
         # Second call should hit API
         fetcher.get_current()
@@ -113,20 +117,16 @@ class TestFearGreedFetcher:
     def test_get_current_api_failure_returns_cached(self, mock_get):
         """Test fallback to cached data on API failure."""
         # First call succeeds
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [{"value": "30", "value_classification": "Fear", "timestamp": "1706918400"}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(_FEAR_30_PAYLOAD)
 
         fetcher = FearGreedFetcher()
         fetcher._retry_count = 1  # Speed up test
+        fetcher._now = lambda: _TS
         data1 = fetcher.get_current()
         assert data1.value == 30
 
-        # Expire cache
-        fetcher._cache_time = datetime.now() - timedelta(hours=2)
+        # Advance the clock past the TTL
+        fetcher._now = lambda: _TS + timedelta(hours=2)
 
         # API fails
         mock_get.side_effect = Exception("Network error")
@@ -149,16 +149,7 @@ class TestFearGreedFetcher:
     @patch('src.sentiment.fear_greed.requests.get')
     def test_get_historical(self, mock_get):
         """Test fetching historical data."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {"value": "50", "value_classification": "Neutral", "timestamp": "1706918400"},
-                {"value": "45", "value_classification": "Fear", "timestamp": "1706832000"},
-                {"value": "40", "value_classification": "Fear", "timestamp": "1706745600"}
-            ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(_HISTORY_PAYLOAD)
 
         fetcher = FearGreedFetcher()
         history = fetcher.get_historical(days=3)
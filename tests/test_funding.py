@@ -5,94 +5,96 @@ from unittest.mock import patch, Mock
 
 from src.technical.funding import FundingRateFetcher, FundingData
 
+# Fixed timestamp for dataclass construction; these tests never read it.
+_TS = datetime(2024, 1, 1, 12, 0, 0)
 
-class TestFundingData:
-    """Tests for FundingData dataclass."""
-
-    def test_is_extreme_long_boundary(self):
-        """Test extreme long at boundary (0.0005 = yes, 0.0004 = no)."""
-        extreme = FundingData(coin="BTC", current_rate=0.0006, predicted_rate=0.0006, annualized=65.7, timestamp=datetime.now())
-        not_extreme = FundingData(coin="BTC", current_rate=0.0004, predicted_rate=0.0004, annualized=43.8, timestamp=datetime.now())
-
-        assert extreme.is_extreme_long is True
-        assert not_extreme.is_extreme_long is False
-
-    def test_is_extreme_short_boundary(self):
-        """Test extreme short at boundary (-0.0005 = yes, -0.0004 = no)."""
-        extreme = FundingData(coin="BTC", current_rate=-0.0006, predicted_rate=-0.0006, annualized=-65.7, timestamp=datetime.now())
-        not_extreme = FundingData(coin="BTC", current_rate=-0.0004, predicted_rate=-0.0004, annualized=-43.8, timestamp=datetime.now())
-
-        assert extreme.is_extreme_short is True
-        assert not_extreme.is_extreme_short is False
 
-    def test_bias_crowded_long(self):
-        data = FundingData(coin="BTC", current_rate=0.001, predicted_rate=0.001, annualized=109.5, timestamp=datetime.now())
-        assert data.bias == "crowded_long"
+def _annualized(rate):
+    """Annualized % for a per-8h funding rate (3 payments/day, 365 days)."""
+    return rate * 3 * 365 * 100
 
-    def test_bias_crowded_short(self):
-        data = FundingData(coin="BTC", current_rate=-0.001, predicted_rate=-0.001, annualized=-109.5, timestamp=datetime.now())
-        assert data.bias == "crowded_short"
 
-    def test_bias_slight_long(self):
-        data = FundingData(coin="BTC", current_rate=0.0002, predicted_rate=0.0002, annualized=21.9, timestamp=datetime.now())
-        assert data.bias == "slight_long"
-
-    def test_bias_slight_short(self):
-        data = FundingData(coin="BTC", current_rate=-0.0002, predicted_rate=-0.0002, annualized=-21.9, timestamp=datetime.now())
-        assert data.bias == "slight_short"
-
-    def test_bias_neutral(self):
-        data = FundingData(coin="BTC", current_rate=0.00005, predicted_rate=0.00005, annualized=5.5, timestamp=datetime.now())
-        assert data.bias == "neutral"
-
-    def test_contrarian_signal_extreme_long(self):
-        data = FundingData(coin="BTC", current_rate=0.001, predicted_rate=0.001, annualized=109.5, timestamp=datetime.now())
-        assert data.contrarian_signal == "SHORT"
-
-    def test_contrarian_signal_extreme_short(self):
-        data = FundingData(coin="BTC", current_rate=-0.001, predicted_rate=-0.001, annualized=-109.5, timestamp=datetime.now())
-        assert data.contrarian_signal == "LONG"
+class TestFundingData:
+    """Tests for FundingData dataclass."""
 
-    def test_contrarian_signal_neutral(self):
-        data = FundingData(coin="BTC", current_rate=0.0001, predicted_rate=0.0001, annualized=10.95, timestamp=datetime.now())
-        assert data.contrarian_signal is None
+    @pytest.mark.parametrize("rate,extreme_long,extreme_short,bias,contrarian", [
+        (0.001, True, False, "crowded_long", "SHORT"),
+        (0.0006, True, False, "crowded_long", "SHORT"),
+        (0.0004, False, False, "slight_long", None),
+        (0.0002, False, False, "slight_long", None),
+        (0.0001, False, False, "neutral", None),
+        (0.00005, False, False, "neutral", None),
+        (-0.0002, False, False, "slight_short", None),
+        (-0.0004, False, False, "slight_short", None),
+        (-0.0006, False, True, "crowded_short", "LONG"),
+        (-0.001, False, True, "crowded_short", "LONG"),
+    ])
+    def test_positioning(self, rate, extreme_long, extreme_short, bias, contrarian):
+        """Extremes sit beyond +/-0.05% per 8h, slight bias beyond +/-0.01%."""
+        data = FundingData(
+            coin="BTC", current_rate=rate, predicted_rate=rate,
+            annualized=_annualized(rate), timestamp=_TS,
+        )
+
+        assert data.is_extreme_long is extreme_long
+        assert data.is_extreme_short is extreme_short
+        assert data.bias == bias
+        assert data.contrarian_signal == contrarian
+
+
+@pytest.fixture(scope="module")
+def default_fetcher():
+    """Shared default-configured fetcher for tests that only read attributes."""
+    return FundingRateFetcher()
+
+
+@pytest.fixture
+def patched_fetcher(monkeypatch):
+    """Build a FundingRateFetcher whose Bybit calls return canned data.
+
+    Pass a rate string for a successful ticker, or an exception to raise.
+    Tests that assert on call counts patch with Mock instead.
+    """
+    def _make(rate, **kwargs):
+        fetcher = FundingRateFetcher(**kwargs)
+
+        def _fetch_ticker(symbol):
+            if isinstance(rate, Exception):
+                raise rate
+            return {"fundingRate": rate}
+
+        monkeypatch.setattr(fetcher, "_fetch_ticker", _fetch_ticker)
+        monkeypatch.setattr(fetcher, "_fetch_history", lambda symbol, limit=10: [])
+        return fetcher
+    return _make
 
 
 class TestFundingRateFetcher:
     """Tests for FundingRateFetcher."""
 
-    def test_init_default_cache(self):
-        fetcher = FundingRateFetcher()
-        assert fetcher.cache_duration == timedelta(seconds=300)
+    def test_init_default_cache(self, default_fetcher):
+        assert default_fetcher.cache_duration == timedelta(seconds=300)
 
     def test_init_custom_cache(self):
         fetcher = FundingRateFetcher(cache_seconds=600)
         assert fetcher.cache_duration == timedelta(seconds=600)
 
-    def test_get_symbol_known(self):
-        fetcher = FundingRateFetcher()
-        assert fetcher._get_symbol("BTC") == "BTCUSDT"
-        assert fetcher._get_symbol("btc") == "BTCUSDT"
-        assert fetcher._get_symbol("ETH") == "ETHUSDT"
+    def test_get_symbol_known(self, default_fetcher):
+        assert default_fetcher._get_symbol("BTC") == "BTCUSDT"
+        assert default_fetcher._get_symbol("btc") == "BTCUSDT"
+        assert default_fetcher._get_symbol("ETH") == "ETHUSDT"
 
-    def test_get_symbol_unknown(self):
-        fetcher = FundingRateFetcher()
-        assert fetcher._get_symbol("NEWCOIN") == "NEWCOINUSDT"
+    def test_get_symbol_unknown(self, default_fetcher):
+        assert default_fetcher._get_symbol("NEWCOIN") == "NEWCOINUSDT"
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_get_current_success(self, mock_history, mock_ticker):
+    def test_get_current_success(self, patched_fetcher):
         """Test successful funding rate fetch."""
-        mock_ticker.return_value = {"fundingRate": "0.0001"}
-        mock_history.return_value = []
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher("0.0001")
         data = fetcher.get_current("BTC")
 
         assert data.coin == "BTC"
         assert data.current_rate == 0.0001
-        # Annualized: 0.0001 * 3 * 365 * 100 = 10.95%
-        assert abs(data.annualized - 10.95) < 0.01
+        assert data.annualized == pytest.approx(_annualized(0.0001))  # 10.95%
 
     @patch.object(FundingRateFetcher, '_fetch_ticker')
     @patch.object(FundingRateFetcher, '_fetch_history')
@@ -152,52 +154,33 @@ class TestFundingRateFetcher:
         data2 = fetcher.get_current("BTC")
         assert data2.current_rate == 0.0003
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_get_current_api_error_no_cache(self, mock_history, mock_ticker):
+    def test_get_current_api_error_no_cache(self, patched_fetcher):
         """Test returns neutral when API fails and no cache."""
-        mock_ticker.side_effect = Exception("Network error")
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher(Exception("Network error"))
         data = fetcher.get_current("BTC")
 
         assert data.current_rate == 0.0
         assert data.bias == "neutral"
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_should_avoid_direction_long(self, mock_history, mock_ticker):
+    def test_should_avoid_direction_long(self, patched_fetcher):
         """Test avoiding longs when crowded long."""
-        mock_ticker.return_value = {"fundingRate": "0.001"}
-        mock_history.return_value = []
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher("0.001")
         should_avoid, reason = fetcher.should_avoid_direction("BTC", "LONG")
 
         assert should_avoid is True
         assert "Crowded longs" in reason
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_should_avoid_direction_short(self, mock_history, mock_ticker):
+    def test_should_avoid_direction_short(self, patched_fetcher):
         """Test avoiding shorts when crowded short."""
-        mock_ticker.return_value = {"fundingRate": "-0.001"}
-        mock_history.return_value = []
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher("-0.001")
         should_avoid, reason = fetcher.should_avoid_direction("BTC", "SHORT")
 
         assert should_avoid is True
         assert "Crowded shorts" in reason
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_should_avoid_direction_neutral(self, mock_history, mock_ticker):
+    def test_should_avoid_direction_neutral(self, patched_fetcher):
         """Test no avoidance when neutral funding."""
-        mock_ticker.return_value = {"fundingRate": "0.0001"}
-        mock_history.return_value = []
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher("0.0001")
 
         should_avoid_long, _ = fetcher.should_avoid_direction("BTC", "LONG")
         should_avoid_short, _ = fetcher.should_avoid_direction("BTC", "SHORT")
@@ -205,16 +188,10 @@ class TestFundingRateFetcher:
         assert should_avoid_long is False
         assert should_avoid_short is False
 
-    @patch.object(FundingRateFetcher, '_fetch_ticker')
-    @patch.object(FundingRateFetcher, '_fetch_history')
-    def test_annualized_calculation(self, mock_history, mock_ticker):
+    def test_annualized_calculation(self, patched_fetcher):
         """Test annualized rate calculation."""
-        mock_ticker.return_value = {"fundingRate": "0.01"}  # 1% per 8h
-        mock_history.return_value = []
-
-        fetcher = FundingRateFetcher()
+        fetcher = patched_fetcher("0.01")  # 1% per 8h
         data = fetcher.get_current("BTC")
 
-        # 1% * 3 funding periods/day * 365 days = 1095%
-        expected = 0.01 * 3 * 365 * 100
-        assert abs(data.annualized - expected) < 0.1
+        assert data.annualized == pytest.approx(1095.0)
+        assert data.annualized == pytest.approx(_annualized(0.01))
@@ -4,14 +4,14 @@ Integration tests for Strategist → Sniper handoff.
 Tests that conditions flow correctly from LLM generation to Sniper execution.
 """
 
-import asyncio
+import os
 import sys
 from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 import json
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from src.strategist import Strategist
 from src.sniper import Sniper, Position
@@ -20,19 +20,50 @@ from src.market_feed import MarketFeed, PriceTick
 from src.journal import TradeJournal
 
 
+@pytest.fixture(scope="class")
+def journal():
+    """One in-memory journal per test class; the handoff tests only inspect Sniper state.
+
+    Writes are synchronous: no writer thread is needed when nothing reads the journal.
+    """
+    journal = TradeJournal(db_path=":memory:", enable_async=False)
+    yield journal
+    journal.stop()
+
+
+@pytest.fixture
+def sniper(journal):
+    """Fresh Sniper per test on top of the shared journal."""
+    return Sniper(journal, state_path=os.devnull)
+
+
+def _condition(coin, trigger_price, **overrides):
+    """Build a TradeCondition with the defaults these tests share."""
+    fields = dict(
+        direction="LONG",
+        trigger_condition="ABOVE",
+        stop_loss_pct=2.0,
+        take_profit_pct=1.5,
+        position_size_usd=100.0,
+        reasoning="Test",
+        strategy_id="test",
+    )
+    fields.update(overrides)
+    return TradeCondition(coin=coin, trigger_price=trigger_price, **fields)
+
+
 class TestHandoff:
     """Test Strategist → Sniper handoff."""
 
-    def test_callback_wiring(self):
+    def test_callback_wiring(self, sniper):
         """Test that callback wiring works."""
         # Create mocks
-        mock_llm = Mock()
-        mock_market = Mock()
-        mock_market.get_all_prices.return_value = {}
-        mock_market.get_price.return_value = None
+        mock_llm = SimpleNamespace()  # never queried in this test
+        mock_market = SimpleNamespace(
+            get_all_prices=lambda: {},
+            get_price=lambda coin: None,
+        )
 
-        journal = TradeJournal()
-        sniper = Sniper(journal)
         strategist = Strategist(mock_llm, mock_market)
 
         # Track received conditions
@@ -45,17 +76,7 @@ class TestHandoff:
         strategist.subscribe_conditions(on_conditions)
 
         # Simulate callback
-        test_condition = TradeCondition(
-            coin="SOL",
-            direction="LONG",
-            trigger_price=143.50,
-            trigger_condition="ABOVE",
-            stop_loss_pct=2.0,
-            take_profit_pct=1.5,
-            position_size_usd=50.0,
-            reasoning="Test",
-            strategy_id="test",
-        )
+        test_condition = _condition("SOL", 143.50, position_size_usd=50.0)
 
         strategist._notify_callbacks([test_condition])
 
@@ -63,47 +84,24 @@ class TestHandoff:
         assert received[0].coin == "SOL"
         assert len(sniper.active_conditions) == 1
 
-    def test_condition_format_compatibility(self):
+    def test_condition_format_compatibility(self, sniper):
         """Test that Strategist conditions work with Sniper."""
-        journal = TradeJournal()
-        sniper = Sniper(journal)
-
         # Create condition using models.trade_condition (Strategist format)
-        condition = TradeCondition(
-            coin="ETH",
-            direction="LONG",
-            trigger_price=2850.00,
-            trigger_condition="ABOVE",
-            stop_loss_pct=2.0,
-            take_profit_pct=1.5,
-            position_size_usd=75.0,
-            reasoning="Momentum breakout",
-            strategy_id="momentum",
+        condition = _condition(
+            "ETH", 2850.00, position_size_usd=75.0,
+            reasoning="Momentum breakout", strategy_id="momentum",
         )
 
         # Should work with Sniper
         result = sniper.add_condition(condition)
         assert result is True
         assert len(sniper.active_conditions) == 1
-        assert "ETH" in [c.coin for c in sniper.active_conditions.values()]
+        assert any(c.coin == "ETH" for c in sniper.active_conditions.values())
 
-    def test_trigger_condition_field(self):
+    def test_trigger_condition_field(self, sniper):
         """Test that trigger_condition field works correctly."""
-        journal = TradeJournal()
-        sniper = Sniper(journal)
-
         # ABOVE condition
-        above_condition = TradeCondition(
-            coin="BTC",
-            direction="LONG",
-            trigger_price=50000.0,
-            trigger_condition="ABOVE",
-            stop_loss_pct=2.0,
-            take_profit_pct=1.5,
-            position_size_usd=100.0,
-            reasoning="Breakout",
-            strategy_id="test",
-        )
+        above_condition = _condition("BTC", 50000.0, reasoning="Breakout")
         sniper.add_condition(above_condition)
 
         # Price below trigger - should not execute
@@ -116,7 +114,8 @@ class TestHandoff:
         sniper.on_price_tick(tick_above)
         assert len(sniper.open_positions) == 1
 
-    def test_full_handoff_flow(self):
+    @pytest.mark.asyncio
+    async def test_full_handoff_flow(self, sniper):
         """Test complete flow from Strategist generation to Sniper execution."""
         # Setup
         mock_llm = Mock()
@@ -138,16 +137,12 @@ class TestHandoff:
             "no_trade_reason": None,
         })
 
-        mock_tick = Mock()
-        mock_tick.price = 138.00
-        mock_tick.change_24h = 1.0
-
-        mock_market = Mock()
-        mock_market.get_all_prices.return_value = {"SOL": mock_tick}
-        mock_market.get_price.return_value = mock_tick
+        mock_tick = SimpleNamespace(price=138.00, change_24h=1.0)
+        mock_market = SimpleNamespace(
+            get_all_prices=lambda: {"SOL": mock_tick},
+            get_price=lambda coin: mock_tick,
+        )
 
-        journal = TradeJournal()
-        sniper = Sniper(journal)
         strategist = Strategist(mock_llm, mock_market)
 
         # Wire handoff
@@ -156,81 +151,42 @@ class TestHandoff:
 
         strategist.subscribe_conditions(on_conditions)
 
-        # Run async test
-        async def run_test():
-            # Generate conditions
-            conditions = await strategist.generate_conditions()
+        # Generate conditions
+        conditions = await strategist.generate_conditions()
 
-            # Verify conditions were generated
-            assert len(conditions) == 1
+        # Verify conditions were generated
+        assert len(conditions) == 1
 
-            # Notify callbacks (mimics what _run_once does)
-            strategist._notify_callbacks(conditions)
+        # Notify callbacks (mimics what _run_once does)
+        strategist._notify_callbacks(conditions)
 
-            # Verify conditions passed to sniper
-            assert len(sniper.active_conditions) == 1
-
-            # Simulate price tick below trigger
-            tick_below = PriceTick(coin="SOL", price=139.00, timestamp=1000, volume_24h=0, change_24h=0)
-            sniper.on_price_tick(tick_below)
-            assert len(sniper.open_positions) == 0
+        # Verify conditions passed to sniper
+        assert len(sniper.active_conditions) == 1
 
-            # Simulate price tick above trigger
-            tick_above = PriceTick(coin="SOL", price=141.00, timestamp=2000, volume_24h=0, change_24h=0)
-            sniper.on_price_tick(tick_above)
-            assert len(sniper.open_positions) == 1
+        # Simulate price tick below trigger
+        tick_below = PriceTick(coin="SOL", price=139.00, timestamp=1000, volume_24h=0, change_24h=0)
+        sniper.on_price_tick(tick_below)
+        assert len(sniper.open_positions) == 0
 
-            # Verify position details
-            position = list(sniper.open_positions.values())[0]
-            assert position.coin == "SOL"
-            assert position.direction == "LONG"
-            assert position.entry_price == 141.00
+        # Simulate price tick above trigger
+        tick_above = PriceTick(coin="SOL", price=141.00, timestamp=2000, volume_24h=0, change_24h=0)
+        sniper.on_price_tick(tick_above)
+        assert len(sniper.open_positions) == 1
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(run_test())
-        finally:
-            loop.close()
+        # Verify position details
+        position = list(sniper.open_positions.values())[0]
+        assert position.coin == "SOL"
+        assert position.direction == "LONG"
+        assert position.entry_price == 141.00
 
-    def test_multiple_conditions(self):
+    def test_multiple_conditions(self, sniper):
         """Test handling multiple conditions from Strategist."""
-        journal = TradeJournal()
-        sniper = Sniper(journal)
-
         conditions = [
-            TradeCondition(
-                coin="BTC",
-                direction="LONG",
-                trigger_price=50000.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=100.0,
-                reasoning="BTC breakout",
-                strategy_id="test",
-            ),
-            TradeCondition(
-                coin="ETH",
-                direction="LONG",
-                trigger_price=2800.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=75.0,
-                reasoning="ETH breakout",
-                strategy_id="test",
-            ),
-            TradeCondition(
-                coin="SOL",
-                direction="LONG",
-                trigger_price=140.0,
-                trigger_condition="BELOW",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=50.0,
-                reasoning="SOL dip buy",
-                strategy_id="test",
+            _condition("BTC", 50000.0, reasoning="BTC breakout"),
+            _condition("ETH", 2800.0, position_size_usd=75.0, reasoning="ETH breakout"),
+            _condition(
+                "SOL", 140.0, trigger_condition="BELOW",
+                position_size_usd=50.0, reasoning="SOL dip buy",
             ),
         ]
 
@@ -238,91 +194,38 @@ class TestHandoff:
         assert count == 3
         assert len(sniper.active_conditions) == 3
 
-    def test_condition_replacement(self):
+    def test_condition_replacement(self, sniper):
         """Test that new conditions replace old ones."""
-        journal = TradeJournal()
-        sniper = Sniper(journal)
-
         # First set
         first_conditions = [
-            TradeCondition(
-                coin="BTC",
-                direction="LONG",
-                trigger_price=50000.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=100.0,
-                reasoning="Old",
-                strategy_id="test",
-            ),
+            _condition("BTC", 50000.0, reasoning="Old"),
         ]
         sniper.set_conditions(first_conditions)
         assert len(sniper.active_conditions) == 1
 
         # Second set (should replace)
         second_conditions = [
-            TradeCondition(
-                coin="ETH",
-                direction="LONG",
-                trigger_price=2800.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=75.0,
-                reasoning="New",
-                strategy_id="test",
-            ),
-            TradeCondition(
-                coin="SOL",
-                direction="LONG",
-                trigger_price=140.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=50.0,
-                reasoning="New",
-                strategy_id="test",
-            ),
+            _condition("ETH", 2800.0, position_size_usd=75.0, reasoning="New"),
+            _condition("SOL", 140.0, position_size_usd=50.0, reasoning="New"),
         ]
         sniper.set_conditions(second_conditions)
 
         # Should have 2 new conditions, not 3
         assert len(sniper.active_conditions) == 2
-        coins = [c.coin for c in sniper.active_conditions.values()]
-        assert "BTC" not in coins
-        assert "ETH" in coins
-        assert "SOL" in coins
+        coins = {c.coin for c in sniper.active_conditions.values()}
+        assert coins == {"ETH", "SOL"}
 
-    def test_expired_conditions_filtered(self):
+    def test_expired_conditions_filtered(self, sniper):
         """Test that expired conditions are filtered out."""
-        journal = TradeJournal()
-        sniper = Sniper(journal)
-
+        now = datetime.now()
         conditions = [
-            TradeCondition(
-                coin="BTC",
-                direction="LONG",
-                trigger_price=50000.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=100.0,
-                reasoning="Active",
-                strategy_id="test",
-                valid_until=datetime.now() + timedelta(minutes=5),
+            _condition(
+                "BTC", 50000.0, reasoning="Active",
+                valid_until=now + timedelta(minutes=5),
             ),
-            TradeCondition(
-                coin="ETH",
-                direction="LONG",
-                trigger_price=2800.0,
-                trigger_condition="ABOVE",
-                stop_loss_pct=2.0,
-                take_profit_pct=1.5,
-                position_size_usd=75.0,
-                reasoning="Expired",
-                strategy_id="test",
-                valid_until=datetime.now() - timedelta(minutes=1),  # Already expired
+            _condition(
+                "ETH", 2800.0, position_size_usd=75.0, reasoning="Expired",
+                valid_until=now - timedelta(minutes=1),  # Already expired
             ),
         ]
 
@@ -334,5 +237,4 @@ class TestHandoff:
 
 # Run tests directly
 if __name__ == "__main__":
-    import pytest
-    pytest.main([__file__, "-v"])
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,88 @@
+"""
+Tests for HealthMonitor.
+
+Imports only the monitor and PriceTick, not the TradingSystem stack.
+"""
+
+import time
+
+import pytest
+
+from src.health_monitor import HealthMonitor, aggregate_health
+from src.market_feed import PriceTick
+
+
+def _tick(coin="BTC", price=50000.0):
+    return PriceTick(coin=coin, price=price, timestamp=int(time.time() * 1000),
+                     volume_24h=0, change_24h=0)
+
+
+@pytest.fixture
+def monitor():
+    return HealthMonitor(stale_threshold=5)
+
+
+class TestHealthMonitor:
+    """Test tick tracking and staleness detection."""
+
+    def test_initial_state(self, monitor):
+        assert monitor.tick_count == 0
+        assert monitor.error_count == 0
+        assert not monitor.is_healthy
+        assert monitor.is_feed_stale
+
+    def test_on_tick_tracks_prices(self, monitor):
+        monitor.on_tick(_tick("BTC", 50000.0))
+        monitor.on_tick(_tick("ETH", 3000.0))
+        monitor.on_tick(_tick("BTC", 50100.0))
+
+        assert monitor.tick_count == 3
+        assert monitor.get_last_price("btc") == 50100.0
+        assert monitor.get_last_price("ETH") == 3000.0
+        assert monitor.get_last_price("SOL") is None
+        assert monitor.is_healthy
+        assert not monitor.is_feed_stale
+
+    def test_stale_after_threshold(self, monitor):
+        monitor.on_tick(_tick())
+        monitor.last_tick_time -= 5  # Last tick was stale_threshold seconds ago
+
+        assert not monitor.is_healthy
+        assert monitor.is_feed_stale
+
+    def test_on_error_counts(self, monitor):
+        monitor.on_error(RuntimeError("boom"))
+        monitor.on_error(ValueError("bad"))
+
+        assert monitor.error_count == 2
+
+    def test_get_stats(self, monitor):
+        monitor.on_tick(_tick("BTC"))
+        monitor.on_tick(_tick("ETH"))
+
+        stats = monitor.get_stats()
+
+        assert stats["healthy"] is True
+        assert stats["feed_stale"] is False
+        assert stats["tick_count"] == 2
+        assert stats["error_count"] == 0
+        assert stats["coins_with_prices"] == 2
+        assert stats["ticks_per_second"] >= 0
+
+
+class TestAggregateHealth:
+    """Test rolling component health up into an overall status."""
+
+    @pytest.mark.parametrize(
+        "statuses, expected",
+        [
+            (["healthy", "not_initialized"], "healthy"),
+            (["healthy", "degraded"], "degraded"),
+            (["healthy", "error"], "degraded"),
+            (["degraded", "failed", "healthy"], "failed"),
+        ],
+    )
+    def test_aggregate(self, statuses, expected):
+        healths = {f"c{i}": {"status": s} for i, s in enumerate(statuses)}
+
+        assert aggregate_health(healths) == expected
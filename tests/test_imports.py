@@ -1,22 +1,24 @@
 """Test that all modules can be imported."""
+import importlib
+import pkgutil
 
+import pytest
 
-def test_import_modules():
-    """Verify all src modules can be imported."""
-    from src import database
-    from src import llm_interface
-    from src import main
-    from src import strategist
-    from src import market_feed
-    from src import sniper
-    from src import journal
-    from src import knowledge
-    from src import coin_scorer
-    from src import quick_update
-    from src import pattern_library
-    from src import reflection
-    from src import adaptation
-    from src import profitability
-    from src import effectiveness
-    from src import dashboard_v2
-    assert True
+import src
+
+
+# Every module under src/ (src/deprecated has no __init__ and is skipped).
+# One case per module, so a broken import is reported by name and
+# `pytest --durations` shows which imports are expensive.
+MODULES = tuple(sorted(info.name for info in pkgutil.walk_packages(src.__path__, "src.")))
+
+
+def test_discovers_core_modules():
+    """Guard against discovery silently finding nothing."""
+    assert {"src.main", "src.sniper", "src.dashboard_v2"} <= set(MODULES)
+
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_import_module(module_name):
+    """Verify each src module can be imported."""
+    importlib.import_module(module_name)
@@ -4,19 +4,14 @@ Integration tests for the full autonomous learning loop (TASK-140).
 Tests end-to-end flows through the system.
 """
 
-import asyncio
 import os
-import sys
+import sqlite3
 import tempfile
-import time
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
-
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.database import Database
+from src.health_monitor import aggregate_health
 from src.knowledge import KnowledgeBrain
 from src.coin_scorer import CoinScorer
 from src.pattern_library import PatternLibrary
@@ -24,22 +19,40 @@ from src.adaptation import AdaptationEngine
 from src.models.reflection import Insight
 
 
+_template_db = None
+
+
+def setUpModule():
+    """Build the bare schema once; each test works on a clone() of it."""
+    global _template_db
+    _template_db = Database(":memory:")
+
+
+def _coin_insight(coin, win_rate=0.20, trades=10, pnl=-10.0, **overrides):
+    """Build a coin/problem Insight that suggests blacklisting the coin."""
+    fields = dict(
+        insight_type="coin",
+        category="problem",
+        title=f"{coin} underperforming",
+        description=f"{coin} has {win_rate:.0%} win rate over {trades} trades",
+        evidence={"coin": coin, "win_rate": win_rate, "trades": trades, "pnl": pnl},
+        suggested_action=f"Blacklist {coin}",
+        confidence=0.90,
+    )
+    fields.update(overrides)
+    return Insight(**fields)
+
+
 class TestComponentHealth(unittest.TestCase):
     """Test that all components expose health status."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
+        """Set up test fixtures on a private in-memory database."""
+        self.db = _template_db.clone()
         self.knowledge = KnowledgeBrain(self.db)
         self.coin_scorer = CoinScorer(self.knowledge, self.db)
         self.pattern_library = PatternLibrary(self.knowledge)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
     def test_adaptation_engine_health(self):
         """Test AdaptationEngine.get_health()."""
         engine = AdaptationEngine(
@@ -67,14 +80,8 @@ class TestRuntimeStatePersistence(unittest.TestCase):
     """Test runtime state save/restore functionality."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
+        """Set up test fixtures on a private in-memory database."""
+        self.db = _template_db.clone()
 
     def test_save_and_restore_state(self):
         """Test that runtime state can be saved and restored."""
@@ -113,9 +120,12 @@ class TestLearningLoopIntegration(unittest.TestCase):
     """Test the complete learning loop integration."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
+        """Set up test fixtures.
+
+        Each test gets its own in-memory database, so no rollback or file
+        cleanup is needed between tests.
+        """
+        self.db = _template_db.clone()
         self.knowledge = KnowledgeBrain(self.db)
         self.coin_scorer = CoinScorer(self.knowledge, self.db)
         self.pattern_library = PatternLibrary(self.knowledge)
@@ -123,23 +133,10 @@ class TestLearningLoopIntegration(unittest.TestCase):
             self.knowledge, self.coin_scorer, self.pattern_library, self.db
         )
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
-
     def test_insight_to_blacklist_flow(self):
         """Test: Insight -> AdaptationEngine -> KnowledgeBrain blacklist."""
         # Simulate an insight from ReflectionEngine
-        insight = Insight(
-            insight_type="coin",
-            category="problem",
-            title="DOGE underperforming",
-            description="DOGE has 20% win rate over 10 trades",
-            evidence={"coin": "DOGE", "win_rate": 0.20, "trades": 10, "pnl": -15.0},
-            suggested_action="Blacklist DOGE",
-            confidence=0.90,
-        )
+        insight = _coin_insight("DOGE", pnl=-15.0)
 
         # Before: DOGE not blacklisted
         self.assertFalse(self.knowledge.is_blacklisted("DOGE"))
@@ -158,8 +155,9 @@ class TestLearningLoopIntegration(unittest.TestCase):
     def test_blacklisted_coin_excluded_from_good_coins(self):
         """Test: Blacklisted coins are excluded from good_coins list."""
         # First, add some trades for SOL to make it "good"
-        for i in range(6):
-            self.knowledge.update_coin_score("SOL", {"won": True, "pnl": 5.0})
+        with self.knowledge.batch():
+            for i in range(6):
+                self.knowledge.update_coin_score("SOL", {"won": True, "pnl": 5.0})
 
         # Verify SOL is in good coins
         self.assertIn("SOL", self.knowledge.get_good_coins())
@@ -172,15 +170,7 @@ class TestLearningLoopIntegration(unittest.TestCase):
 
     def test_adaptation_logged_to_database(self):
         """Test: Adaptations are logged to database for tracking."""
-        insight = Insight(
-            insight_type="coin",
-            category="problem",
-            title="XRP underperforming",
-            description="XRP has 15% win rate",
-            evidence={"coin": "XRP", "win_rate": 0.15, "trades": 10, "pnl": -20.0},
-            suggested_action="Blacklist XRP",
-            confidence=0.90,
-        )
+        insight = _coin_insight("XRP", win_rate=0.15, pnl=-20.0)
 
         self.adaptation_engine.apply_insights([insight])
 
@@ -203,30 +193,18 @@ class TestLearningLoopIntegration(unittest.TestCase):
         )
 
         # Before: No time rules
-        rules_before = self.knowledge.get_active_rules()
-        time_rules_before = [r for r in rules_before if "time_filter" in r.rule_id]
-        self.assertEqual(len(time_rules_before), 0)
+        self.assertEqual(self.knowledge.get_rules_matching("time_filter"), [])
 
         # Apply insight
         adaptations = self.adaptation_engine.apply_insights([insight])
 
         # After: Time rule should exist
-        rules_after = self.knowledge.get_active_rules()
-        time_rules_after = [r for r in rules_after if "time_filter" in r.rule_id]
-        self.assertEqual(len(time_rules_after), 1)
+        self.assertEqual(len(self.knowledge.get_rules_matching("time_filter")), 1)
         self.assertEqual(len(adaptations), 1)
 
     def test_cooldown_prevents_duplicate_adaptations(self):
         """Test: Same adaptation cannot be applied twice within cooldown period."""
-        insight = Insight(
-            insight_type="coin",
-            category="problem",
-            title="SHIB underperforming",
-            description="SHIB has 20% win rate",
-            evidence={"coin": "SHIB", "win_rate": 0.20, "trades": 10, "pnl": -10.0},
-            suggested_action="Blacklist SHIB",
-            confidence=0.90,
-        )
+        insight = _coin_insight("SHIB")
 
         # First application should succeed
         adaptations1 = self.adaptation_engine.apply_insights([insight])
@@ -250,16 +228,7 @@ class TestSystemHealthAggregation(unittest.TestCase):
             "reflection_engine": {"status": "healthy"},
         }
 
-        # Aggregate
-        overall = "healthy"
-        for name, health in component_healths.items():
-            status = health.get("status")
-            if status == "failed":
-                overall = "failed"
-            elif status == "degraded" and overall == "healthy":
-                overall = "degraded"
-
-        self.assertEqual(overall, "degraded")
+        self.assertEqual(aggregate_health(component_healths), "degraded")
 
     def test_health_aggregation_failed(self):
         """Test that overall health fails when any component fails."""
@@ -268,111 +237,103 @@ class TestSystemHealthAggregation(unittest.TestCase):
             "sniper": {"status": "healthy"},
         }
 
-        overall = "healthy"
-        for name, health in component_healths.items():
-            status = health.get("status")
-            if status == "failed":
-                overall = "failed"
-            elif status == "degraded" and overall == "healthy":
-                overall = "degraded"
-
-        self.assertEqual(overall, "failed")
+        self.assertEqual(aggregate_health(component_healths), "failed")
 
 
 class TestKnowledgeBrainPersistence(unittest.TestCase):
-    """Test that Knowledge Brain state persists across restarts."""
+    """Test that Knowledge Brain state persists across restarts.
 
-    def test_coin_scores_persist(self):
-        """Test that coin scores survive restart."""
-        db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    Each test seeds an in-memory database, copies it to a file once with
+    the SQLite backup API, and reopens that file as the restarted instance.
+    """
 
+    def setUp(self):
+        """Create the file the restarted instance is loaded from."""
+        db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_fd)
+        self.addCleanup(os.unlink, self.db_path)
+
+    def _restart(self, db):
+        """Write an in-memory Database to self.db_path and reopen it from disk."""
+        src = db._get_connection()
+        dst = sqlite3.connect(self.db_path)
         try:
-            # Create first instance and add data
-            db1 = Database(db_path)
-            knowledge1 = KnowledgeBrain(db1)
-            knowledge1.update_coin_score("ETH", {"won": True, "pnl": 10.0})
-            knowledge1.blacklist_coin("BAD", "Testing")
-
-            # Verify data exists
-            score1 = knowledge1.get_coin_score("ETH")
-            self.assertIsNotNone(score1)
-            self.assertEqual(score1.wins, 1)
-            self.assertTrue(knowledge1.is_blacklisted("BAD"))
-
-            # Create second instance (simulating restart)
-            db2 = Database(db_path)
-            knowledge2 = KnowledgeBrain(db2)
-
-            # Verify data persisted
-            score2 = knowledge2.get_coin_score("ETH")
-            self.assertIsNotNone(score2)
-            self.assertEqual(score2.wins, 1)
-            self.assertTrue(knowledge2.is_blacklisted("BAD"))
-
+            src.backup(dst)
         finally:
-            os.close(db_fd)
-            os.unlink(db_path)
+            dst.close()
+            src.close()
+        return Database(self.db_path)
+
+    def test_coin_scores_persist(self):
+        """Test that coin scores survive restart."""
+        # Create first instance and add data
+        db1 = _template_db.clone()
+        knowledge1 = KnowledgeBrain(db1)
+        knowledge1.update_coin_score("ETH", {"won": True, "pnl": 10.0})
+        knowledge1.blacklist_coin("BAD", "Testing")
+
+        # Verify data exists
+        score1 = knowledge1.get_coin_score("ETH")
+        self.assertIsNotNone(score1)
+        self.assertEqual(score1.wins, 1)
+        self.assertTrue(knowledge1.is_blacklisted("BAD"))
+
+        # Create second instance (simulating restart)
+        db2 = self._restart(db1)
+        knowledge2 = KnowledgeBrain(db2)
+
+        # Verify data persisted
+        score2 = knowledge2.get_coin_score("ETH")
+        self.assertIsNotNone(score2)
+        self.assertEqual(score2.wins, 1)
+        self.assertTrue(knowledge2.is_blacklisted("BAD"))
 
     def test_patterns_persist(self):
         """Test that trading patterns survive restart."""
-        db_fd, db_path = tempfile.mkstemp(suffix=".db")
+        # Create first instance
+        db1 = _template_db.clone()
+        knowledge1 = KnowledgeBrain(db1)
+        patterns1 = PatternLibrary(knowledge1)
 
-        try:
-            # Create first instance
-            db1 = Database(db_path)
-            knowledge1 = KnowledgeBrain(db1)
-            patterns1 = PatternLibrary(knowledge1)
+        # PatternLibrary seeds default patterns into an empty library
+        patterns = knowledge1.get_active_patterns()
+        self.assertTrue(patterns, "PatternLibrary should seed patterns")
+        initial_count = len(patterns)
 
-            # Get initial pattern count
-            initial_count = len(knowledge1.get_active_patterns())
+        # Deactivate a pattern
+        knowledge1.deactivate_pattern(patterns[0].pattern_id)
 
-            # Deactivate a pattern
-            patterns = knowledge1.get_active_patterns()
-            if patterns:
-                knowledge1.deactivate_pattern(patterns[0].pattern_id)
+        # Create second instance (simulating restart)
+        db2 = self._restart(db1)
+        knowledge2 = KnowledgeBrain(db2)
 
-            # Create second instance (simulating restart)
-            db2 = Database(db_path)
-            knowledge2 = KnowledgeBrain(db2)
-
-            # Verify deactivation persisted
-            new_count = len(knowledge2.get_active_patterns())
-            self.assertEqual(new_count, initial_count - 1)
-
-        finally:
-            os.close(db_fd)
-            os.unlink(db_path)
+        # Verify deactivation persisted
+        new_count = len(knowledge2.get_active_patterns())
+        self.assertEqual(new_count, initial_count - 1)
 
     def test_rules_persist(self):
         """Test that regime rules survive restart."""
-        db_fd, db_path = tempfile.mkstemp(suffix=".db")
+        # Create first instance
+        db1 = _template_db.clone()
+        knowledge1 = KnowledgeBrain(db1)
+
+        from src.models.knowledge import RegimeRule
+        rule = RegimeRule(
+            rule_id="test_rule_persist",
+            description="Test rule for persistence",
+            condition={"hour_of_day": {"op": "in", "value": [1, 2, 3]}},
+            action="REDUCE_SIZE",
+        )
+        knowledge1.add_rule(rule)
 
-        try:
-            # Create first instance
-            db1 = Database(db_path)
-            knowledge1 = KnowledgeBrain(db1)
-
-            from src.models.knowledge import RegimeRule
-            rule = RegimeRule(
-                rule_id="test_rule_persist",
-                description="Test rule for persistence",
-                condition={"hour_of_day": {"op": "in", "value": [1, 2, 3]}},
-                action="REDUCE_SIZE",
-            )
-            knowledge1.add_rule(rule)
-
-            # Create second instance (simulating restart)
-            db2 = Database(db_path)
-            knowledge2 = KnowledgeBrain(db2)
-
-            # Verify rule persisted
-            rules = knowledge2.get_active_rules()
-            rule_ids = [r.rule_id for r in rules]
-            self.assertIn("test_rule_persist", rule_ids)
+        # Create second instance (simulating restart)
+        db2 = self._restart(db1)
+        knowledge2 = KnowledgeBrain(db2)
 
-        finally:
-            os.close(db_fd)
-            os.unlink(db_path)
+        # Verify rule persisted
+        rules = knowledge2.get_active_rules()
+        rule_ids = [r.rule_id for r in rules]
+        self.assertIn("test_rule_persist", rule_ids)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,11 @@ Tests for Trade Journal.
 """
 
 import sys
-import tempfile
-import time
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from src.journal import (
     TradeJournal, JournalEntry, JournalDatabase, MarketContext, AsyncWriteQueue
@@ -20,20 +18,38 @@ from src.journal import (
 # Mock Position for testing
 # =============================================================================
 
+@dataclass(slots=True, frozen=True)
 class MockPosition:
     """Mock Position object for testing."""
-    def __init__(self, **kwargs):
-        self.id = kwargs.get('id', 'pos-123')
-        self.coin = kwargs.get('coin', 'BTC')
-        self.direction = kwargs.get('direction', 'LONG')
-        self.entry_price = kwargs.get('entry_price', 42000.0)
-        self.entry_time = kwargs.get('entry_time', datetime.now())
-        self.size_usd = kwargs.get('size_usd', 100.0)
-        self.stop_loss_price = kwargs.get('stop_loss_price', 41160.0)
-        self.take_profit_price = kwargs.get('take_profit_price', 42630.0)
-        self.condition_id = kwargs.get('condition_id', 'cond-123')
-        self.strategy_id = kwargs.get('strategy_id', 'test-strategy')
-        self.reasoning = kwargs.get('reasoning', 'Test trade')
+    id: str = 'pos-123'
+    coin: str = 'BTC'
+    direction: str = 'LONG'
+    entry_price: float = 42000.0
+    entry_time: datetime = field(default_factory=datetime.now)
+    size_usd: float = 100.0
+    stop_loss_price: float = 41160.0
+    take_profit_price: float = 42630.0
+    condition_id: str = 'cond-123'
+    strategy_id: str = 'test-strategy'
+    reasoning: str = 'Test trade'
+
+
+def _make_entry(entry_id: str, coin: str = "BTC", **overrides) -> JournalEntry:
+    """Build an open LONG JournalEntry; position_id is derived from entry_id."""
+    fields = dict(
+        position_id=f"pos-{entry_id}",
+        entry_time=datetime.now(),
+        entry_price=42000.0,
+        entry_reason="Test",
+        direction="LONG",
+        position_size_usd=100.0,
+        stop_loss_price=41000.0,
+        take_profit_price=43000.0,
+        strategy_id="test",
+        condition_id="c-1",
+    )
+    fields.update(overrides)
+    return JournalEntry(id=entry_id, coin=coin, **fields)
 
 
 # =============================================================================
@@ -163,117 +179,94 @@ class TestJournalEntry:
 class TestJournalDatabase:
     """Test JournalDatabase operations."""
 
+    @classmethod
+    def setup_class(cls):
+        # One in-memory database for the class; rows are cleared per test
+        cls.db = JournalDatabase(":memory:")
+
+    def setup_method(self):
+        with self.db._get_connection() as conn:
+            conn.execute("DELETE FROM trade_journal")
+
     def test_create_and_insert(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            db = JournalDatabase(str(db_path))
-
-            entry = JournalEntry(
-                id="j-test-1",
-                position_id="pos-1",
-                entry_time=datetime.now(),
-                entry_price=42000.0,
-                entry_reason="Test",
-                coin="BTC",
-                direction="LONG",
-                position_size_usd=100.0,
-                stop_loss_price=41000.0,
-                take_profit_price=43000.0,
-                strategy_id="test",
-                condition_id="c-1",
-            )
-
-            db.insert(entry)
-
-            # Verify it was inserted
-            result = db.get("j-test-1")
-            assert result is not None
-            assert result.coin == "BTC"
+        self.db.insert(_make_entry("j-test-1"))
+
+        # Verify it was inserted
+        result = self.db.get("j-test-1")
+        assert result is not None
+        assert result.coin == "BTC"
 
     def test_update(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            db = JournalDatabase(str(db_path))
-
-            entry = JournalEntry(
-                id="j-test-2",
-                position_id="pos-2",
-                entry_time=datetime.now(),
-                entry_price=42000.0,
-                entry_reason="Test",
-                coin="BTC",
-                direction="LONG",
-                position_size_usd=100.0,
-                stop_loss_price=41000.0,
-                take_profit_price=43000.0,
-                strategy_id="test",
-                condition_id="c-1",
-            )
-            db.insert(entry)
-
-            # Update with exit info
-            db.update("j-test-2", {
-                'exit_price': 42500.0,
-                'exit_reason': 'take_profit',
-                'pnl_usd': 1.19,
-                'status': 'closed',
-            })
+        self.db.insert(_make_entry("j-test-2"))
+
+        # Update with exit info
+        self.db.update("j-test-2", {
+            'exit_price': 42500.0,
+            'exit_reason': 'take_profit',
+            'pnl_usd': 1.19,
+            'status': 'closed',
+        })
 
-            result = db.get("j-test-2")
-            assert result.exit_price == 42500.0
-            assert result.exit_reason == "take_profit"
-            assert result.status == "closed"
+        result = self.db.get("j-test-2")
+        assert result.exit_price == 42500.0
+        assert result.exit_reason == "take_profit"
+        assert result.status == "closed"
 
     def test_query(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            db = JournalDatabase(str(db_path))
-
-            # Insert multiple entries
-            for i, coin in enumerate(['BTC', 'ETH', 'BTC', 'SOL']):
-                entry = JournalEntry(
-                    id=f"j-{i}",
-                    position_id=f"pos-{i}",
-                    entry_time=datetime.now(),
-                    entry_price=42000.0,
-                    entry_reason="Test",
-                    coin=coin,
-                    direction="LONG",
-                    position_size_usd=100.0,
-                    stop_loss_price=41000.0,
-                    take_profit_price=43000.0,
-                    strategy_id="test",
-                    condition_id="c-1",
-                )
-                db.insert(entry)
-
-            # Query BTC only
-            btc_entries = db.query(where="coin = ?", params=("BTC",))
-            assert len(btc_entries) == 2
+        self.db.insert_many(
+            _make_entry(f"j-{i}", coin=coin)
+            for i, coin in enumerate(['BTC', 'ETH', 'BTC', 'SOL'])
+        )
+
+        for coin, expected in (("BTC", 2), ("ETH", 1), ("SOL", 1), ("DOGE", 0)):
+            entries = self.db.query(where="coin = ?", params=(coin,))
+            assert len(entries) == expected, coin
 
     def test_count(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            db = JournalDatabase(str(db_path))
-
-            for i in range(5):
-                entry = JournalEntry(
-                    id=f"j-{i}",
-                    position_id=f"pos-{i}",
-                    entry_time=datetime.now(),
-                    entry_price=42000.0,
-                    entry_reason="Test",
-                    coin="BTC",
-                    direction="LONG",
-                    position_size_usd=100.0,
-                    stop_loss_price=41000.0,
-                    take_profit_price=43000.0,
-                    strategy_id="test",
-                    condition_id="c-1",
-                )
-                db.insert(entry)
-
-            assert db.count() == 5
+        self.db.insert_many(_make_entry(f"j-{i}") for i in range(5))
+
+        assert self.db.count() == 5
+
+    def test_insert_many_empty(self):
+        self.db.insert_many([])
+
+        assert self.db.count() == 0
+
+    def test_in_memory_database_persists_across_calls(self):
+        db = JournalDatabase(":memory:")
+        other = JournalDatabase(":memory:")
+
+        db.insert(_make_entry("j-mem-1"))
+
+        # Later calls must still see the row
+        assert db.get("j-mem-1") is not None
+        assert db.count() == 1
+        # Separate instances get separate databases
+        assert other.count() == 0
+
+    def test_position_lookup_uses_index(self):
+        with self.db._get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM trade_journal WHERE position_id = ?",
+                ("pos-1",)
+            ).fetchall()
+
+        assert any("idx_journal_position" in row["detail"] for row in plan)
+
+    def test_filter_queries_use_indexes(self):
+        queries = {
+            "idx_journal_coin": ("coin = ?", "BTC"),
+            "idx_journal_strategy": ("strategy_id = ?", "s1"),
+            "idx_journal_exit_reason": ("exit_reason = ?", "stop_loss"),
+            "idx_journal_pnl": ("pnl_usd > ?", 0),
+        }
+        with self.db._get_connection() as conn:
+            for index, (where, param) in queries.items():
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT * FROM trade_journal WHERE {where}",
+                    (param,)
+                ).fetchall()
+                assert any(index in row["detail"] for row in plan), index
 
 
 # =============================================================================
@@ -284,114 +277,160 @@ class TestTradeJournal:
     """Test TradeJournal main class."""
 
     def test_init(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
 
-            assert journal.entry_count() == 0
-            assert len(journal.pending_entries) == 0
+        assert journal.entry_count() == 0
+        assert len(journal.pending_entries) == 0
 
     def test_record_entry(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            position = MockPosition(
-                id="pos-test-1",
-                coin="BTC",
-                entry_price=42000.0,
-                direction="LONG",
-            )
-
-            timestamp = int(datetime.now().timestamp() * 1000)
-            entry_id = journal.record_entry(position, timestamp)
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+
+        position = MockPosition(
+            id="pos-test-1",
+            coin="BTC",
+            entry_price=42000.0,
+            direction="LONG",
+        )
 
-            assert entry_id is not None
-            assert "pos-test-1" in journal.pending_entries
-            assert journal.entry_count() == 1
+        timestamp = int(datetime.now().timestamp() * 1000)
+        entry_id = journal.record_entry(position, timestamp)
+
+        assert entry_id is not None
+        assert "pos-test-1" in journal.pending_entries
+        assert journal.entry_count() == 1
 
     def test_record_entry_with_market_context(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            position = MockPosition(id="pos-ctx-1")
-            ctx = MarketContext(
-                regime="trending",
-                volatility=0.02,
-                btc_trend="up",
-                btc_price=78000.0
-            )
-
-            timestamp = int(datetime.now().timestamp() * 1000)
-            entry_id = journal.record_entry(position, timestamp, market_context=ctx)
-
-            entry = journal.get_entry(entry_id)
-            assert entry.market_regime == "trending"
-            assert entry.volatility == 0.02
-            assert entry.btc_trend == "up"
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+
+        position = MockPosition(id="pos-ctx-1")
+        ctx = MarketContext(
+            regime="trending",
+            volatility=0.02,
+            btc_trend="up",
+            btc_price=78000.0
+        )
+
+        timestamp = int(datetime.now().timestamp() * 1000)
+        entry_id = journal.record_entry(position, timestamp, market_context=ctx)
+
+        entry = journal.get_entry(entry_id)
+        assert entry.market_regime == "trending"
+        assert entry.volatility == 0.02
+        assert entry.btc_trend == "up"
 
     def test_record_exit(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            # Record entry
-            position = MockPosition(
-                id="pos-exit-1",
-                coin="BTC",
-                entry_price=42000.0,
-                size_usd=100.0,
-            )
-            entry_timestamp = int(datetime.now().timestamp() * 1000)
-            entry_id = journal.record_entry(position, entry_timestamp)
-
-            # Wait a moment
-            time.sleep(0.1)
-
-            # Record exit
-            exit_timestamp = int(datetime.now().timestamp() * 1000)
-            exit_id = journal.record_exit(
-                position=position,
-                exit_price=42500.0,
-                timestamp=exit_timestamp,
-                reason="take_profit",
-                pnl=1.19
-            )
-
-            assert exit_id == entry_id
-
-            # Verify exit recorded
-            entry = journal.get_entry(entry_id)
-            assert entry.exit_price == 42500.0
-            assert entry.exit_reason == "take_profit"
-            assert entry.pnl_usd == 1.19
-            assert entry.status == "closed"
-            assert entry.duration_seconds >= 0
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+
+        # Record entry
+        position = MockPosition(
+            id="pos-exit-1",
+            coin="BTC",
+            entry_price=42000.0,
+            size_usd=100.0,
+        )
+        entry_timestamp = int(datetime.now().timestamp() * 1000)
+        entry_id = journal.record_entry(position, entry_timestamp)
+
+        # Record exit 90 s later; durations come from the timestamps passed in
+        exit_timestamp = entry_timestamp + 90_000
+        exit_id = journal.record_exit(
+            position=position,
+            exit_price=42500.0,
+            timestamp=exit_timestamp,
+            reason="take_profit",
+            pnl=1.19
+        )
+
+        assert exit_id == entry_id
+
+        # Verify exit recorded
+        entry = journal.get_entry(entry_id)
+        assert entry.exit_price == 42500.0
+        assert entry.exit_reason == "take_profit"
+        assert entry.pnl_usd == 1.19
+        assert entry.status == "closed"
+        assert entry.duration_seconds == 90
 
     def test_timing_context(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
 
-            position = MockPosition(id="pos-time-1")
-            now = datetime.now()
-            timestamp = int(now.timestamp() * 1000)
+        position = MockPosition(id="pos-time-1")
+        now = datetime.now()
+        timestamp = int(now.timestamp() * 1000)
 
-            entry_id = journal.record_entry(position, timestamp)
-            entry = journal.get_entry(entry_id)
+        entry_id = journal.record_entry(position, timestamp)
+        entry = journal.get_entry(entry_id)
 
-            assert entry.hour_of_day == now.hour
-            assert entry.day_of_week == now.weekday()
+        assert entry.hour_of_day == now.hour
+        assert entry.day_of_week == now.weekday()
+
+    def test_batch_defers_writes_until_exit(self):
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+        position = MockPosition(id="pos-batch-1")
+        timestamp = int(datetime.now().timestamp() * 1000)
+
+        with journal.batch():
+            entry_id = journal.record_entry(position, timestamp)
+            journal.record_exit(position, 42500.0, timestamp, "take_profit", 1.19)
+            assert journal.db.count() == 0
+
+        entry = journal.db.get(entry_id)
+        assert entry.status == "closed"
+        assert entry.exit_reason == "take_profit"
+
+    def test_record_batch(self):
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+        entry_time = datetime.now().replace(microsecond=0)
+        entry_ts = int(entry_time.timestamp() * 1000)
+
+        entry_ids = journal.record_batch([
+            {
+                'position': MockPosition(id=f"pos-rb-{i}", size_usd=200.0),
+                'entry_timestamp': entry_ts,
+                'exit_price': 42500.0,
+                'exit_timestamp': entry_ts + 60_000,
+                'reason': 'take_profit',
+                'pnl': 3.0,
+            }
+            for i in range(3)
+        ])
+
+        assert len(entry_ids) == 3
+        assert journal.db.count() == 3
+        assert journal.pending_entries == {}
+        # Same derived fields record_entry()/record_exit() give live trades
+        entry = journal.get_entry(entry_ids[0])
+        assert entry.status == "closed"
+        assert entry.hour_of_day == entry_time.hour
+        assert entry.duration_seconds == 60
+        assert abs(entry.pnl_pct - 1.5) < 0.01  # $3 on $200
+
+    def test_batch_discards_writes_on_error(self):
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
+        position = MockPosition(id="pos-batch-err")
+        timestamp = int(datetime.now().timestamp() * 1000)
+
+        with pytest.raises(RuntimeError):
+            with journal.batch():
+                journal.record_entry(position, timestamp)
+                raise RuntimeError("boom")
+
+        assert journal.db.count() == 0
+        # The open-trade cache is not rolled back
+        assert "pos-batch-err" in journal.pending_entries
+
+        # The journal is usable again afterwards
+        journal.record_entry(MockPosition(id="pos-batch-ok"), timestamp)
+        assert journal.db.count() == 1
 
 
 class TestJournalQueries:
     """Test journal query methods."""
 
-    def _setup_journal_with_data(self, tmp_dir) -> TradeJournal:
-        """Create a journal with test data."""
-        db_path = Path(tmp_dir) / "test.db"
-        journal = TradeJournal(db_path=str(db_path), enable_async=False)
+    @classmethod
+    def setup_class(cls):
+        """Create a journal with test data, shared read-only by every test in the class."""
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
 
         # Insert several trades
         trades = [
@@ -402,88 +441,95 @@ class TestJournalQueries:
             {'coin': 'SOL', 'pnl': 10.0, 'reason': 'take_profit', 'strategy': 's1'},
         ]
 
-        for i, trade in enumerate(trades):
-            position = MockPosition(
-                id=f"pos-q-{i}",
-                coin=trade['coin'],
-                entry_price=100.0,
-                size_usd=100.0,
-                strategy_id=trade['strategy'],
-            )
-
-            entry_ts = int(datetime.now().timestamp() * 1000)
-            journal.record_entry(position, entry_ts)
-
-            exit_ts = int(datetime.now().timestamp() * 1000)
-            journal.record_exit(
-                position=position,
-                exit_price=100.0 + trade['pnl'],
-                timestamp=exit_ts,
-                reason=trade['reason'],
-                pnl=trade['pnl']
-            )
-
-        return journal
+        # Record every entry and exit with one commit
+        base_ts = int(datetime.now().timestamp() * 1000)
+        journal.record_batch(
+            {
+                'position': MockPosition(
+                    id=f"pos-q-{i}",
+                    coin=trade['coin'],
+                    entry_price=100.0,
+                    size_usd=100.0,
+                    strategy_id=trade['strategy'],
+                ),
+                'entry_timestamp': base_ts + i * 2,
+                'exit_price': 100.0 + trade['pnl'],
+                'exit_timestamp': base_ts + i * 2 + 1,
+                'reason': trade['reason'],
+                'pnl': trade['pnl'],
+            }
+            for i, trade in enumerate(trades)
+        )
+
+        cls.journal = journal
 
     def test_get_by_coin(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal_with_data(tmp)
+        journal = self.journal
 
-            btc = journal.get_by_coin('BTC')
-            assert len(btc) == 2
+        btc = journal.get_by_coin('BTC')
+        assert len(btc) == 2
 
-            eth = journal.get_by_coin('ETH')
-            assert len(eth) == 2
+        eth = journal.get_by_coin('ETH')
+        assert len(eth) == 2
 
-            sol = journal.get_by_coin('SOL')
-            assert len(sol) == 1
+        sol = journal.get_by_coin('SOL')
+        assert len(sol) == 1
 
     def test_get_by_strategy(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal_with_data(tmp)
+        journal = self.journal
 
-            s1 = journal.get_by_strategy('s1')
-            assert len(s1) == 3
+        s1 = journal.get_by_strategy('s1')
+        assert len(s1) == 3
 
-            s2 = journal.get_by_strategy('s2')
-            assert len(s2) == 2
+        s2 = journal.get_by_strategy('s2')
+        assert len(s2) == 2
 
     def test_get_by_exit_reason(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal_with_data(tmp)
+        journal = self.journal
+
+        tp = journal.get_by_exit_reason('take_profit')
+        assert len(tp) == 3
+
+        sl = journal.get_by_exit_reason('stop_loss')
+        assert len(sl) == 2
 
-            tp = journal.get_by_exit_reason('take_profit')
-            assert len(tp) == 3
+    def test_get_closed_after(self):
+        journal = self.journal
 
-            sl = journal.get_by_exit_reason('stop_loss')
-            assert len(sl) == 2
+        past = datetime.now() - timedelta(hours=1)
+        closed = journal.get_closed_after(past)
+        assert len(closed) == 5
+        assert all(e.status == 'closed' for e in closed)
+        # Newest first, so a limit keeps the most recent exits
+        assert closed[0].exit_time >= closed[-1].exit_time
+        assert journal.get_closed_after(past, limit=1) == closed[:1]
+
+        assert journal.get_closed_after(datetime.now() + timedelta(hours=1)) == []
 
     def test_get_winners(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal_with_data(tmp)
+        journal = self.journal
 
-            winners = journal.get_winners()
-            assert len(winners) == 3
-            # Should be ordered by pnl DESC
-            assert winners[0].pnl_usd >= winners[1].pnl_usd
+        winners = journal.get_winners()
+        assert len(winners) == 3
+        # Should be ordered by pnl DESC
+        assert winners[0].pnl_usd >= winners[1].pnl_usd
 
     def test_get_losers(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal_with_data(tmp)
+        journal = self.journal
 
-            losers = journal.get_losers()
-            assert len(losers) == 2
-            # Should be ordered by pnl ASC (most negative first)
-            assert losers[0].pnl_usd <= losers[1].pnl_usd
+        losers = journal.get_losers()
+        assert len(losers) == 2
+        # Should be ordered by pnl ASC (most negative first)
+        assert losers[0].pnl_usd <= losers[1].pnl_usd
 
 
 class TestJournalStatistics:
     """Test journal statistics methods."""
 
-    def _setup_journal(self, tmp_dir) -> TradeJournal:
-        """Create a journal with predictable data."""
-        db_path = Path(tmp_dir) / "test.db"
-        journal = TradeJournal(db_path=str(db_path), enable_async=False)
+    @classmethod
+    def setup_class(cls):
+        """Create a journal with predictable data, shared read-only by every test in the class."""
+        journal = TradeJournal(db_path=":memory:", enable_async=False)
 
         # 3 wins, 2 losses
         trades = [
@@ -494,185 +540,149 @@ class TestJournalStatistics:
             {'coin': 'SOL', 'pnl': -2.0},
         ]
 
-        for i, trade in enumerate(trades):
-            position = MockPosition(
-                id=f"pos-s-{i}",
-                coin=trade['coin'],
-                size_usd=100.0,
-            )
-
-            entry_ts = int(datetime.now().timestamp() * 1000)
-            journal.record_entry(position, entry_ts)
-
-            exit_ts = int(datetime.now().timestamp() * 1000)
-            journal.record_exit(
-                position=position,
-                exit_price=100.0,
-                timestamp=exit_ts,
-                reason='test',
-                pnl=trade['pnl']
-            )
+        # Record every entry and exit with one commit
+        base_ts = int(datetime.now().timestamp() * 1000)
+        journal.record_batch(
+            {
+                'position': MockPosition(
+                    id=f"pos-s-{i}",
+                    coin=trade['coin'],
+                    size_usd=100.0,
+                ),
+                'entry_timestamp': base_ts + i * 2,
+                'exit_price': 100.0,
+                'exit_timestamp': base_ts + i * 2 + 1,
+                'reason': 'test',
+                'pnl': trade['pnl'],
+            }
+            for i, trade in enumerate(trades)
+        )
 
-        return journal
+        cls.journal = journal
 
     def test_get_stats(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal(tmp)
+        journal = self.journal
 
-            stats = journal.get_stats()
+        stats = journal.get_stats()
 
-            assert stats['total_trades'] == 5
-            assert stats['wins'] == 3
-            assert stats['losses'] == 2
-            assert stats['win_rate'] == 60.0
-            assert stats['total_pnl'] == 18.0  # 10+5-3+8-2
-            assert stats['best_trade'] == 10.0
-            assert stats['worst_trade'] == -3.0
+        assert stats['total_trades'] == 5
+        assert stats['wins'] == 3
+        assert stats['losses'] == 2
+        assert stats['win_rate'] == 60.0
+        assert stats['total_pnl'] == 18.0  # 10+5-3+8-2
+        assert stats['best_trade'] == 10.0
+        assert stats['worst_trade'] == -3.0
 
     def test_get_stats_filtered_by_coin(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal(tmp)
+        journal = self.journal
 
-            btc_stats = journal.get_stats(coin='BTC')
+        btc_stats = journal.get_stats(coin='BTC')
 
-            assert btc_stats['total_trades'] == 2
-            assert btc_stats['wins'] == 2
-            assert btc_stats['total_pnl'] == 15.0  # 10+5
+        assert btc_stats['total_trades'] == 2
+        assert btc_stats['wins'] == 2
+        assert btc_stats['total_pnl'] == 15.0  # 10+5
 
     def test_get_performance_by_coin(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            journal = self._setup_journal(tmp)
+        journal = self.journal
 
-            by_coin = journal.get_performance_by_coin()
+        by_coin = journal.get_performance_by_coin()
 
-            assert 'BTC' in by_coin
-            assert 'ETH' in by_coin
-            assert 'SOL' in by_coin
+        assert 'BTC' in by_coin
+        assert 'ETH' in by_coin
+        assert 'SOL' in by_coin
 
-            assert by_coin['BTC']['trades'] == 2
-            assert by_coin['BTC']['win_rate'] == 100.0
+        assert by_coin['BTC']['trades'] == 2
+        assert by_coin['BTC']['win_rate'] == 100.0
 
 
 class TestAsyncWriteQueue:
     """Test async write queue."""
 
     def test_queue_operations(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            db = JournalDatabase(str(db_path))
-            queue = AsyncWriteQueue(db)
-
-            queue.start()
-
-            # Queue an insert
-            entry = JournalEntry(
-                id="j-async-1",
-                position_id="pos-async-1",
-                entry_time=datetime.now(),
-                entry_price=42000.0,
-                entry_reason="Test",
-                coin="BTC",
-                direction="LONG",
-                position_size_usd=100.0,
-                stop_loss_price=41000.0,
-                take_profit_price=43000.0,
-                strategy_id="test",
-                condition_id="c-1",
-            )
-            queue.enqueue_insert(entry)
-
-            # Wait for processing
-            time.sleep(1)
+        db = JournalDatabase(":memory:")
+        queue = AsyncWriteQueue(db)
+
+        queue.start()
+
+        # Queue an insert
+        entry = _make_entry("j-async-1")
+        queue.enqueue_insert(entry)
+
+        # Wait for the writer thread to apply it
+        assert queue.flush()
+
+        # Verify it was written
+        result = db.get("j-async-1")
+        queue.stop()
+        assert result is not None
+        assert result.coin == "BTC"
 
+    def test_flush_waits_for_pending_writes(self):
+        db = JournalDatabase(":memory:")
+        queue = AsyncWriteQueue(db)
+        queue.start()
+        try:
+            queue.enqueue_insert(_make_entry("j-flush-1"))
+            queue.enqueue_update("j-flush-1", {"status": "closed"})
+
+            assert queue.flush()
+
+            # Visible while the writer is still running
+            assert db.get("j-flush-1").status == "closed"
+        finally:
+            queue.stop()
+
+    def test_flush_times_out_when_writer_is_stuck(self):
+        release = threading.Event()
+
+        class StuckDatabase:
+            def insert(self, entry):
+                release.wait()
+
+        queue = AsyncWriteQueue(StuckDatabase())
+        queue.start()
+        try:
+            queue.enqueue_insert(_make_entry("j-stuck-1"))
+
+            assert queue.flush(timeout=0.05) is False
+        finally:
+            release.set()
             queue.stop()
 
-            # Verify it was written
-            result = db.get("j-async-1")
-            assert result is not None
-            assert result.coin == "BTC"
+    def test_in_memory_reads_during_async_writes(self):
+        # The writer thread and the reading thread share one in-memory
+        # database; neither side may hit "table is locked"
+        db = JournalDatabase(":memory:")
+        queue = AsyncWriteQueue(db)
+        queue.start()
+        try:
+            for i in range(500):
+                queue.enqueue_insert(_make_entry(f"j-rw-{i}"))
+                db.count()  # Raises OperationalError on a lock conflict
+
+            assert queue.flush()
+            assert db.count() == 500  # No write was dropped by the writer
+        finally:
+            queue.stop()
 
 
 class TestMissedProfitCalculation:
     """Test missed profit calculation logic."""
 
-    def test_missed_profit_long_price_went_up(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            # LONG exit at 100, price went to 105 = missed 5%
-            missed = journal._calculate_missed_profit("LONG", 100.0, 105.0)
-            assert abs(missed - 5.0) < 0.01
-
-    def test_missed_profit_long_price_went_down(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            # LONG exit at 100, price went to 95 = dodged -5%
-            missed = journal._calculate_missed_profit("LONG", 100.0, 95.0)
-            assert abs(missed - (-5.0)) < 0.01
-
-    def test_missed_profit_short_price_went_down(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            # SHORT exit at 100, price went to 95 = missed 5% profit
-            missed = journal._calculate_missed_profit("SHORT", 100.0, 95.0)
-            assert abs(missed - 5.0) < 0.01
-
-    def test_missed_profit_short_price_went_up(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            db_path = Path(tmp) / "test.db"
-            journal = TradeJournal(db_path=str(db_path), enable_async=False)
-
-            # SHORT exit at 100, price went to 105 = dodged -5% loss
-            missed = journal._calculate_missed_profit("SHORT", 100.0, 105.0)
-            assert abs(missed - (-5.0)) < 0.01
-
-
-def run_tests():
-    """Run all tests manually."""
-    import traceback
-
-    test_classes = [
-        TestMarketContext,
-        TestJournalEntry,
-        TestJournalDatabase,
-        TestTradeJournal,
-        TestJournalQueries,
-        TestJournalStatistics,
-        TestAsyncWriteQueue,
-        TestMissedProfitCalculation,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_class in test_classes:
-        print(f"\n=== {test_class.__name__} ===")
-        instance = test_class()
-
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    method = getattr(instance, method_name)
-                    method()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    traceback.print_exc()
-                    failed += 1
-
-    print(f"\n{'='*40}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print(f"{'='*40}")
-
-    return failed == 0
+    @pytest.mark.parametrize(
+        "direction, exit_price, later_price, expected",
+        [
+            ("LONG", 100.0, 105.0, 5.0),    # Price went up: missed 5%
+            ("LONG", 100.0, 95.0, -5.0),    # Price went down: dodged -5%
+            ("SHORT", 100.0, 95.0, 5.0),    # Price went down: missed 5% profit
+            ("SHORT", 100.0, 105.0, -5.0),  # Price went up: dodged -5% loss
+        ],
+    )
+    def test_missed_profit(self, direction, exit_price, later_price, expected):
+        # Pure calculation; no journal or database needed
+        missed = TradeJournal._calculate_missed_profit(direction, exit_price, later_price)
+        assert abs(missed - expected) < 0.01
 
 
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-v"]))
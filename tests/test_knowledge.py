@@ -250,11 +250,7 @@ class TestKnowledgeBrain:
 
     @pytest.fixture
     def brain(self, tmp_path):
-        """Create a fresh KnowledgeBrain with temp file database.
-
-        Note: SQLite :memory: databases don't work with the Database class
-        because each _get_connection() call creates a new empty database.
-        """
+        """Create a fresh KnowledgeBrain with temp file database."""
         db_path = str(tmp_path / "test_brain.db")
         db = Database(db_path)
         return KnowledgeBrain(db)
@@ -294,6 +290,38 @@ class TestKnowledgeBrain:
         assert score.avg_winner == 4.0  # (5+3)/2
         assert score.avg_loser == -2.0
 
+    def test_batch_defers_coin_score_writes(self, brain):
+        """Test batch() saves each updated coin once, on exit."""
+        saved = []
+        save_coin_score = brain.db.save_coin_score
+        brain.db.save_coin_score = lambda data: (saved.append(data["coin"]), save_coin_score(data))
+
+        with brain.batch():
+            for _ in range(3):
+                brain.update_coin_score("SOL", {"won": True, "pnl": 5.0})
+            brain.update_coin_score("ETH", {"won": False, "pnl": -1.0})
+            assert saved == []
+            # In-memory score is current before the flush
+            assert brain.get_coin_score("SOL").total_trades == 3
+
+        assert sorted(saved) == ["ETH", "SOL"]
+        reloaded = KnowledgeBrain(brain.db)
+        assert reloaded.get_coin_score("SOL").total_trades == 3
+        assert reloaded.get_coin_score("ETH").losses == 1
+
+    def test_batch_discards_writes_on_error(self, brain):
+        """Test batch() saves nothing if the block raises."""
+        with pytest.raises(RuntimeError):
+            with brain.batch():
+                brain.update_coin_score("SOL", {"won": True, "pnl": 5.0})
+                raise RuntimeError("boom")
+
+        assert KnowledgeBrain(brain.db).get_coin_score("SOL") is None
+
+        # Batching is off again, so the next update saves immediately
+        brain.update_coin_score("SOL", {"won": True, "pnl": 5.0})
+        assert KnowledgeBrain(brain.db).get_coin_score("SOL").total_trades == 2
+
     def test_get_good_coins(self, brain):
         """Test identifying good performing coins."""
         # Add coin with good performance
@@ -354,6 +382,31 @@ class TestKnowledgeBrain:
         brain.blacklist_coin("MANA", "Manual blacklist")
         assert "MANA" not in brain.get_good_coins()
 
+    def test_good_coins_cache_invalidated_on_change(self, brain):
+        """Test that cached good coins track score and blacklist changes."""
+        for _ in range(5):
+            brain.update_coin_score("SOL", {"won": True, "pnl": 2.0})
+
+        good = brain.get_good_coins()
+        good.append("XRP")  # Callers get a copy, not the cached list
+        assert brain.get_good_coins() == ["SOL"]
+        assert brain.get_good_coins(min_trades=10) == []
+
+        brain.blacklist_coin("SOL", "Manual blacklist")
+        assert brain.get_good_coins() == []
+
+        brain.unblacklist_coin("SOL")
+        for _ in range(6):
+            brain.update_coin_score("SOL", {"won": False, "pnl": -1.0})
+        assert brain.get_good_coins() == []
+
+    def test_good_coins_cache_invalidated_on_favor(self, brain):
+        """Test that favoring an unseen coin shows up in cached good coins."""
+        assert brain.get_good_coins(min_trades=0, min_win_rate=0.0) == []
+
+        brain.favor_coin("AVAX", "Strong insight")
+        assert brain.get_good_coins(min_trades=0, min_win_rate=0.0) == ["AVAX"]
+
     # === Pattern Tests ===
 
     def test_add_pattern(self, brain):
@@ -482,6 +535,21 @@ class TestKnowledgeBrain:
         brain.deactivate_rule("temp_rule")
         assert len(brain.get_active_rules()) == 0
 
+    def test_get_rules_matching(self, brain):
+        """Test filtering active rules by ID prefix."""
+        for rule_id in ("time_filter_1", "time_filter_2", "vol_check"):
+            brain.add_rule(RegimeRule(
+                rule_id=rule_id,
+                description=rule_id,
+                condition={},
+                action="NO_TRADE",
+            ))
+        brain.deactivate_rule("time_filter_2")
+
+        matching = brain.get_rules_matching("time_filter")
+
+        assert [r.rule_id for r in matching] == ["time_filter_1"]
+
     # === Strategist Interface Tests ===
 
     def test_get_knowledge_context(self, brain):
@@ -203,9 +203,9 @@ class TestKnowledgeToPrompt:
 class TestRegimeRuleEnforcement:
     """Test regime rules are enforced before condition generation."""
 
-    def test_no_trade_rule_skips_generation(self, knowledge_brain, coin_scorer, pattern_library, mock_market_feed, mock_llm, temp_db):
+    @pytest.mark.asyncio
+    async def test_no_trade_rule_skips_generation(self, knowledge_brain, coin_scorer, pattern_library, mock_market_feed, mock_llm, temp_db):
         """NO_TRADE rule prevents condition generation."""
-        import asyncio
         from src.strategist import Strategist
 
         # Add a rule that always triggers
@@ -226,13 +226,10 @@ class TestRegimeRuleEnforcement:
             db=temp_db,
         )
 
-        async def run_test():
-            conditions = await strategist.generate_conditions()
-            # Should return empty list without calling LLM
-            assert conditions == []
-            mock_llm.query.assert_not_called()
-
-        asyncio.run(run_test())
+        conditions = await strategist.generate_conditions()
+        # Should return empty list without calling LLM
+        assert conditions == []
+        mock_llm.query.assert_not_called()
 
     def test_reduce_size_rule_halves_positions(self, knowledge_brain, coin_scorer, pattern_library, mock_market_feed, mock_llm, temp_db):
         """REDUCE_SIZE rule halves position sizes."""
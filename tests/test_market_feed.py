@@ -8,10 +8,6 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import asdict
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.market_feed import MarketFeed, PriceTick, TradeEvent, CoinConfig, FeedStatus
 
 
@@ -118,92 +114,86 @@ class TestStreamUrlBuilding:
 class TestMessageHandling:
     """Test WebSocket message parsing."""
 
-    def test_handle_binance_trade(self):
-        async def run_test():
-            feed = MarketFeed(['BTC'], exchange='binance')
-            received_trades = []
-            received_prices = []
-
-            feed.subscribe_trades(lambda t: received_trades.append(t))
-            feed.subscribe_price(lambda p: received_prices.append(p))
-
-            # Simulate Binance trade data
-            trade_data = {
-                's': 'BTCUSDT',
-                'p': '42000.50',
-                'q': '0.001',
-                'T': 1672515782136,
-                'm': True
-            }
-
-            await feed._handle_binance_trade(trade_data)
-
-            # Should have received trade event
-            assert len(received_trades) == 1
-            assert received_trades[0].coin == 'BTC'
-            assert received_trades[0].price == 42000.50
-            assert received_trades[0].is_buyer_maker == True
-
-            # Should have received price update
-            assert len(received_prices) == 1
-            assert received_prices[0].coin == 'BTC'
-            assert received_prices[0].price == 42000.50
-
-        asyncio.run(run_test())
-
-    def test_handle_bybit_trade(self):
-        async def run_test():
-            feed = MarketFeed(['BTC'], exchange='bybit')
-            received_trades = []
-            received_prices = []
-
-            feed.subscribe_trades(lambda t: received_trades.append(t))
-            feed.subscribe_price(lambda p: received_prices.append(p))
-
-            # Simulate Bybit trade data
-            trade_data = {
-                's': 'BTCUSDT',
-                'p': '42000.50',
-                'v': '0.001',
-                'T': 1672515782136,
-                'S': 'Sell'
-            }
-
-            await feed._handle_bybit_trade(trade_data)
-
-            # Should have received trade event
-            assert len(received_trades) == 1
-            assert received_trades[0].coin == 'BTC'
-            assert received_trades[0].price == 42000.50
-
-            # Should have received price update
-            assert len(received_prices) == 1
-            assert received_prices[0].coin == 'BTC'
-            assert received_prices[0].price == 42000.50
-
-        asyncio.run(run_test())
-
-    def test_ignore_unknown_symbol(self):
-        async def run_test():
-            feed = MarketFeed(['BTC'], exchange='binance')  # Only BTC
-            received = []
-            feed.subscribe_price(lambda p: received.append(p))
-
-            # Send ETH trade (not subscribed)
-            trade_data = {
-                's': 'ETHUSDT',
-                'p': '2500.00',
-                'q': '1.0',
-                'T': 1672515782136,
-                'm': False
-            }
-
-            await feed._handle_binance_trade(trade_data)
-
-            # Should not trigger callback
-            assert len(received) == 0
-
-        asyncio.run(run_test())
+    @pytest.mark.asyncio
+    async def test_handle_binance_trade(self):
+        feed = MarketFeed(['BTC'], exchange='binance')
+        received_trades = []
+        received_prices = []
+
+        feed.subscribe_trades(lambda t: received_trades.append(t))
+        feed.subscribe_price(lambda p: received_prices.append(p))
+
+        # Simulate Binance trade data
+        trade_data = {
+            's': 'BTCUSDT',
+            'p': '42000.50',
+            'q': '0.001',
+            'T': 1672515782136,
+            'm': True
+        }
+
+        await feed._handle_binance_trade(trade_data)
+
+        # Should have received trade event
+        assert len(received_trades) == 1
+        assert received_trades[0].coin == 'BTC'
+        assert received_trades[0].price == 42000.50
+        assert received_trades[0].is_buyer_maker == True
+
+        # Should have received price update
+        assert len(received_prices) == 1
+        assert received_prices[0].coin == 'BTC'
+        assert received_prices[0].price == 42000.50
+
+    @pytest.mark.asyncio
+    async def test_handle_bybit_trade(self):
+        feed = MarketFeed(['BTC'], exchange='bybit')
+        received_trades = []
+        received_prices = []
+
+        feed.subscribe_trades(lambda t: received_trades.append(t))
+        feed.subscribe_price(lambda p: received_prices.append(p))
+
+        # Simulate Bybit trade data
+        trade_data = {
+            's': 'BTCUSDT',
+            'p': '42000.50',
+            'v': '0.001',
+            'T': 1672515782136,
+            'S': 'Sell'
+        }
+
+        await feed._handle_bybit_trade(trade_data)
+
+        # Should have received trade event
+        assert len(received_trades) == 1
+        assert received_trades[0].coin == 'BTC'
+        assert received_trades[0].price == 42000.50
+
+        # Should have received price update
+        assert len(received_prices) == 1
+        assert received_prices[0].coin == 'BTC'
+        assert received_prices[0].price == 42000.50
+
+    @pytest.mark.asyncio
+    async def test_ignore_unknown_symbol(self):
+        feed = MarketFeed(['BTC'], exchange='binance')  # Only BTC
+        received = []
+        feed.subscribe_price(lambda p: received.append(p))
+
+        # Send ETH trade (not subscribed)
+        trade_data = {
+            's': 'ETHUSDT',
+            'p': '2500.00',
+            'q': '1.0',
+            'T': 1672515782136,
+            'm': False
+        }
+
+        await feed._handle_binance_trade(trade_data)
+
+        # Should not trigger callback
+        assert len(received) == 0
 
 
 class TestCallbacks:
@@ -243,57 +233,53 @@ class TestCallbacks:
 
         assert len(feed._price_callbacks) == 3
 
-    def test_callback_error_doesnt_break_feed(self):
-        async def run_test():
-            feed = MarketFeed(['BTC'], exchange='binance')
-            good_received = []
-
-            def bad_callback(tick):
-                raise Exception("Callback error!")
+    @pytest.mark.asyncio
+    async def test_callback_error_doesnt_break_feed(self):
+        feed = MarketFeed(['BTC'], exchange='binance')
+        good_received = []
 
-            def good_callback(tick):
-                good_received.append(tick)
+        def bad_callback(tick):
+            raise Exception("Callback error!")
 
-            feed.subscribe_price(bad_callback)
-            feed.subscribe_price(good_callback)
+        def good_callback(tick):
+            good_received.append(tick)
 
-            # Simulate trade (using Binance handler)
-            await feed._handle_binance_trade({
-                's': 'BTCUSDT',
-                'p': '42000.00',
-                'q': '0.001',
-                'T': 1672515782136,
-                'm': False
-            })
+        feed.subscribe_price(bad_callback)
+        feed.subscribe_price(good_callback)
 
-            # Good callback should still be called despite bad callback error
-            assert len(good_received) == 1
+        # Simulate trade (using Binance handler)
+        await feed._handle_binance_trade({
+            's': 'BTCUSDT',
+            'p': '42000.00',
+            'q': '0.001',
+            'T': 1672515782136,
+            'm': False
+        })
 
-        asyncio.run(run_test())
+        # Good callback should still be called despite bad callback error
+        assert len(good_received) == 1
 
 
 class TestPriceCache:
     """Test price caching functionality."""
 
-    def test_get_price(self):
-        async def run_test():
-            feed = MarketFeed(['BTC', 'ETH'], exchange='binance')
-
-            # Simulate price update
-            await feed._handle_binance_trade({
-                's': 'BTCUSDT',
-                'p': '42000.00',
-                'q': '0.001',
-                'T': 1672515782136,
-                'm': False
-            })
+    @pytest.mark.asyncio
+    async def test_get_price(self):
+        feed = MarketFeed(['BTC', 'ETH'], exchange='binance')
 
-            price = feed.get_price('BTC')
-            assert price is not None
-            assert price.price == 42000.00
-            assert price.coin == 'BTC'
+        # Simulate price update
+        await feed._handle_binance_trade({
+            's': 'BTCUSDT',
+            'p': '42000.00',
+            'q': '0.001',
+            'T': 1672515782136,
+            'm': False
+        })
 
-        asyncio.run(run_test())
+        price = feed.get_price('BTC')
+        assert price is not None
+        assert price.price == 42000.00
+        assert price.coin == 'BTC'
 
     def test_get_price_not_found(self):
         feed = MarketFeed(['BTC'])
@@ -309,19 +295,17 @@ class TestPriceCache:
         assert feed.get_price('btc') is not None
         assert feed.get_price('BTC') is not None
 
-    def test_get_all_prices(self):
-        async def run_test():
-            feed = MarketFeed(['BTC', 'ETH'], exchange='binance')
-
-            await feed._handle_binance_trade({'s': 'BTCUSDT', 'p': '42000', 'q': '0.001', 'T': 0, 'm': False})
-            await feed._handle_binance_trade({'s': 'ETHUSDT', 'p': '2500', 'q': '0.1', 'T': 0, 'm': False})
+    @pytest.mark.asyncio
+    async def test_get_all_prices(self):
+        feed = MarketFeed(['BTC', 'ETH'], exchange='binance')
 
-            prices = feed.get_all_prices()
-            assert 'BTC' in prices
-            assert 'ETH' in prices
-            assert prices['BTC'].price == 42000
+        await feed._handle_binance_trade({'s': 'BTCUSDT', 'p': '42000', 'q': '0.001', 'T': 0, 'm': False})
+        await feed._handle_binance_trade({'s': 'ETHUSDT', 'p': '2500', 'q': '0.1', 'T': 0, 'm': False})
 
-        asyncio.run(run_test())
+        prices = feed.get_all_prices()
+        assert 'BTC' in prices
+        assert 'ETH' in prices
+        assert prices['BTC'].price == 42000
 
 
 class TestStatus:
@@ -256,7 +256,6 @@ class TestQuickUpdateProcessing:
         ))
 
         assert result.processing_time_ms > 0
-        assert result.processing_time_ms < 100  # Should be fast
 
     def test_stats_updated(self, quick_update):
         """QuickUpdate stats are incremented."""
@@ -333,6 +332,7 @@ class TestPatternUpdates:
         assert result.pattern_id is None
 
 
+@pytest.mark.wallclock
 class TestPerformance:
     """Tests for QuickUpdate performance requirements."""
 
@@ -279,36 +279,32 @@ class TestExitAnalysis:
 class TestLLMInsightGeneration:
     """Tests for LLM insight generation."""
 
-    def test_generate_insights(self, reflection_engine, mock_journal, mock_llm):
+    @pytest.mark.asyncio
+    async def test_generate_insights(self, reflection_engine, mock_journal, mock_llm):
         """LLM generates structured insights."""
-        import asyncio
-
-        async def run_test():
-            trades = mock_journal.get_recent()
-
-            coin_analyses = reflection_engine._analyze_by_coin(trades)
-            pattern_analyses = reflection_engine._analyze_by_pattern(trades)
-            time_analysis = reflection_engine._analyze_by_time(trades)
-            regime_analysis = reflection_engine._analyze_by_regime(trades)
-            exit_analysis = reflection_engine._analyze_exits(trades)
-
-            insights, summary = await reflection_engine._generate_insights(
-                trades=trades,
-                coin_analyses=coin_analyses,
-                pattern_analyses=pattern_analyses,
-                time_analysis=time_analysis,
-                regime_analysis=regime_analysis,
-                exit_analysis=exit_analysis,
-                period_hours=12.0,
-                total_pnl=5.0,
-                win_rate=0.54,
-            )
-
-            assert len(insights) == 2
-            assert "SOL" in summary
-            assert insights[0].insight_type == "coin"
-
-        asyncio.run(run_test())
+        trades = mock_journal.get_recent()
+
+        coin_analyses = reflection_engine._analyze_by_coin(trades)
+        pattern_analyses = reflection_engine._analyze_by_pattern(trades)
+        time_analysis = reflection_engine._analyze_by_time(trades)
+        regime_analysis = reflection_engine._analyze_by_regime(trades)
+        exit_analysis = reflection_engine._analyze_exits(trades)
+
+        insights, summary = await reflection_engine._generate_insights(
+            trades=trades,
+            coin_analyses=coin_analyses,
+            pattern_analyses=pattern_analyses,
+            time_analysis=time_analysis,
+            regime_analysis=regime_analysis,
+            exit_analysis=exit_analysis,
+            period_hours=12.0,
+            total_pnl=5.0,
+            win_rate=0.54,
+        )
+
+        assert len(insights) == 2
+        assert "SOL" in summary
+        assert insights[0].insight_type == "coin"
 
     def test_parse_llm_response(self, reflection_engine):
         """Can parse valid LLM JSON response."""
@@ -384,67 +380,51 @@ class TestTriggerConditions:
 class TestFullReflection:
     """Tests for full reflection cycle."""
 
-    def test_full_reflect(self, reflection_engine):
+    @pytest.mark.asyncio
+    async def test_full_reflect(self, reflection_engine):
         """Full reflection produces valid result."""
-        import asyncio
-
-        async def run_test():
-            result = await reflection_engine.reflect()
-
-            assert isinstance(result, ReflectionResult)
-            assert result.trades_analyzed == 13
-            assert len(result.insights) > 0
-            assert result.summary != ""
-            assert result.total_time_ms > 0
+        result = await reflection_engine.reflect()
 
-        asyncio.run(run_test())
+        assert isinstance(result, ReflectionResult)
+        assert result.trades_analyzed == 13
+        assert len(result.insights) > 0
+        assert result.summary != ""
+        assert result.total_time_ms > 0
 
-    def test_reflect_updates_state(self, reflection_engine):
+    @pytest.mark.asyncio
+    async def test_reflect_updates_state(self, reflection_engine):
         """Reflection updates internal state."""
-        import asyncio
+        reflection_engine.trades_since_reflection = 15
 
-        async def run_test():
-            reflection_engine.trades_since_reflection = 15
+        await reflection_engine.reflect()
 
-            await reflection_engine.reflect()
+        assert reflection_engine.trades_since_reflection == 0
+        assert reflection_engine.last_reflection_time is not None
+        assert reflection_engine.reflections_completed == 1
 
-            assert reflection_engine.trades_since_reflection == 0
-            assert reflection_engine.last_reflection_time is not None
-            assert reflection_engine.reflections_completed == 1
-
-        asyncio.run(run_test())
-
-    def test_reflect_empty_journal(self, reflection_engine, mock_journal):
+    @pytest.mark.asyncio
+    async def test_reflect_empty_journal(self, reflection_engine, mock_journal):
         """Handles empty journal gracefully."""
-        import asyncio
-
-        async def run_test():
-            mock_journal.get_recent.return_value = []
+        mock_journal.get_recent.return_value = []
 
-            result = await reflection_engine.reflect()
+        result = await reflection_engine.reflect()
 
-            assert result.trades_analyzed == 0
-            assert len(result.insights) == 0
-
-        asyncio.run(run_test())
+        assert result.trades_analyzed == 0
+        assert len(result.insights) == 0
 
 
 class TestDatabaseIntegration:
     """Tests for database logging."""
 
-    def test_reflection_logged_to_db(self, reflection_engine, temp_db):
+    @pytest.mark.asyncio
+    async def test_reflection_logged_to_db(self, reflection_engine, temp_db):
         """Reflection is saved to database."""
-        import asyncio
-
-        async def run_test():
-            await reflection_engine.reflect()
-
-            reflections = temp_db.get_recent_reflections(limit=1)
+        await reflection_engine.reflect()
 
-            assert len(reflections) == 1
-            assert reflections[0]["trades_analyzed"] == 13
+        reflections = temp_db.get_recent_reflections(limit=1)
 
-        asyncio.run(run_test())
+        assert len(reflections) == 1
+        assert reflections[0]["trades_analyzed"] == 13
 
 
 class TestOnTradeClose:
@@ -9,6 +9,8 @@ import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.sniper import Sniper, Position, ExecutionEvent
@@ -272,6 +274,38 @@ class TestConditionManagement:
         assert cleared == 2
         assert len(sniper.active_conditions) == 0
 
+    def test_condition_expires_on_tick(self):
+        journal = TradeJournal()
+        sniper = Sniper(journal)
+
+        def condition(cid):
+            return TradeCondition(
+                id=cid,
+                coin="BTC",
+                direction="LONG",
+                trigger_price=42000.0,
+                trigger_condition="ABOVE",
+                stop_loss_pct=2.0,
+                take_profit_pct=1.5,
+                position_size_usd=100.0,
+                strategy_id="test",
+                reasoning="Test",
+                valid_until=datetime.now() + timedelta(minutes=5),
+            )
+
+        tick = PriceTick("BTC", 41000.0, int(time.time() * 1000), 0, 0)
+        sniper.add_condition(condition("cond-1"))
+        sniper.on_price_tick(tick)
+
+        # A newly added condition must be seen by the next expiry check,
+        # even though cond-1 was scanned and expires later
+        late = condition("cond-2")
+        sniper.add_condition(late)
+        late.valid_until = datetime.now() - timedelta(seconds=1)
+        sniper.on_price_tick(tick)
+
+        assert list(sniper.active_conditions) == ["cond-1"]
+
 
 class TestEntryTriggering:
     """Test entry condition triggering."""
@@ -671,6 +705,7 @@ class TestRiskLimits:
         assert len(sniper.open_positions) == 0
 
 
+@pytest.mark.wallclock
 class TestPerformance:
     """Test tick processing performance."""
 
@@ -695,17 +730,19 @@ class TestPerformance:
             )
             sniper.add_condition(condition)
 
+        # Build the ticks and bind the handler outside the timed loop,
+        # so only Sniper.on_price_tick is measured
+        now_ms = int(time.time() * 1000)
+        ticks = [
+            PriceTick(coin="BTC", price=42000.0, timestamp=now_ms, volume_24h=0, change_24h=0)
+            for _ in range(10000)
+        ]
+        on_price_tick = sniper.on_price_tick
+
         # Process 10000 ticks
         start = time.perf_counter()
-        for _ in range(10000):
-            tick = PriceTick(
-                coin="BTC",
-                price=42000.0,
-                timestamp=int(time.time() * 1000),
-                volume_24h=0,
-                change_24h=0
-            )
-            sniper.on_price_tick(tick)
+        for tick in ticks:
+            on_price_tick(tick)
         elapsed = time.perf_counter() - start
 
         per_tick_ms = (elapsed / 10000) * 1000
@@ -850,23 +887,27 @@ def run_tests():
         print(f"\n=== {test_class.__name__} ===")
         instance = test_class()
 
-        for method_name in dir(instance):
-            if method_name.startswith("test_"):
-                try:
-                    method = getattr(instance, method_name)
-                    # Handle tmp_path for persistence test
-                    if "tmp_path" in method.__code__.co_varnames:
-                        import tempfile
-                        with tempfile.TemporaryDirectory() as tmp:
-                            method(Path(tmp))
-                    else:
-                        method()
-                    print(f"  ✓ {method_name}")
-                    passed += 1
-                except Exception as e:
-                    print(f"  ✗ {method_name}: {e}")
-                    traceback.print_exc()
-                    failed += 1
+        # Own test methods in definition order; skips dir()'s sort and inherited attributes
+        test_methods = [
+            name for name, value in vars(test_class).items()
+            if name.startswith("test_") and callable(value)
+        ]
+        for method_name in test_methods:
+            try:
+                method = getattr(instance, method_name)
+                # Handle tmp_path for persistence test
+                if "tmp_path" in method.__code__.co_varnames:
+                    import tempfile
+                    with tempfile.TemporaryDirectory() as tmp:
+                        method(Path(tmp))
+                else:
+                    method()
+                print(f"  ✓ {method_name}")
+                passed += 1
+            except Exception as e:
+                print(f"  ✗ {method_name}: {e}")
+                traceback.print_exc()
+                failed += 1
 
     print(f"\n{'='*40}")
     print(f"Results: {passed} passed, {failed} failed")
@@ -296,88 +296,72 @@ class TestStrategist:
 
         assert len(strategist._condition_callbacks) == 1
 
-    def test_generate_conditions(self, mock_llm, mock_market, mock_db):
+    @pytest.mark.asyncio
+    async def test_generate_conditions(self, mock_llm, mock_market, mock_db):
         """Test condition generation."""
-        import asyncio
-
-        async def run_test():
-            strategist = Strategist(
-                llm=mock_llm,
-                market_feed=mock_market,
-                db=mock_db,
-            )
-
-            conditions = await strategist.generate_conditions()
-
-            assert len(conditions) == 1
-            assert conditions[0].coin == "SOL"
-            assert conditions[0].direction == "LONG"
-            assert conditions[0].trigger_price == 143.50
-            assert mock_llm.query.called
-            assert mock_db.save_condition.called
+        strategist = Strategist(
+            llm=mock_llm,
+            market_feed=mock_market,
+            db=mock_db,
+        )
 
-        asyncio.run(run_test())
+        conditions = await strategist.generate_conditions()
 
-    def test_generate_no_conditions(self, mock_llm, mock_market, mock_db):
+        assert len(conditions) == 1
+        assert conditions[0].coin == "SOL"
+        assert conditions[0].direction == "LONG"
+        assert conditions[0].trigger_price == 143.50
+        assert mock_llm.query.called
+        assert mock_db.save_condition.called
+
+    @pytest.mark.asyncio
+    async def test_generate_no_conditions(self, mock_llm, mock_market, mock_db):
         """Test when LLM returns no conditions."""
-        import asyncio
-
-        async def run_test():
-            mock_llm.query.return_value = json.dumps({
-                "conditions": [],
-                "market_assessment": "Low volatility",
-                "no_trade_reason": "No clear setups",
-            })
-
-            strategist = Strategist(
-                llm=mock_llm,
-                market_feed=mock_market,
-                db=mock_db,
-            )
+        mock_llm.query.return_value = json.dumps({
+            "conditions": [],
+            "market_assessment": "Low volatility",
+            "no_trade_reason": "No clear setups",
+        })
 
-            conditions = await strategist.generate_conditions()
+        strategist = Strategist(
+            llm=mock_llm,
+            market_feed=mock_market,
+            db=mock_db,
+        )
 
-            assert len(conditions) == 0
+        conditions = await strategist.generate_conditions()
 
-        asyncio.run(run_test())
+        assert len(conditions) == 0
 
-    def test_generate_conditions_llm_error(self, mock_llm, mock_market, mock_db):
+    @pytest.mark.asyncio
+    async def test_generate_conditions_llm_error(self, mock_llm, mock_market, mock_db):
         """Test handling of LLM errors."""
-        import asyncio
-
-        async def run_test():
-            mock_llm.query.return_value = None
+        mock_llm.query.return_value = None
 
-            strategist = Strategist(
-                llm=mock_llm,
-                market_feed=mock_market,
-                db=mock_db,
-            )
-
-            conditions = await strategist.generate_conditions()
+        strategist = Strategist(
+            llm=mock_llm,
+            market_feed=mock_market,
+            db=mock_db,
+        )
 
-            assert len(conditions) == 0
+        conditions = await strategist.generate_conditions()
 
-        asyncio.run(run_test())
+        assert len(conditions) == 0
 
-    def test_generate_conditions_invalid_json(self, mock_llm, mock_market, mock_db):
+    @pytest.mark.asyncio
+    async def test_generate_conditions_invalid_json(self, mock_llm, mock_market, mock_db):
         """Test handling of invalid JSON response."""
-        import asyncio
-
-        async def run_test():
-            mock_llm.query.return_value = "not valid json"
+        mock_llm.query.return_value = "not valid json"
 
-            strategist = Strategist(
-                llm=mock_llm,
-                market_feed=mock_market,
-                db=mock_db,
-            )
-
-            conditions = await strategist.generate_conditions()
+        strategist = Strategist(
+            llm=mock_llm,
+            market_feed=mock_market,
+            db=mock_db,
+        )
 
-            assert len(conditions) == 0
+        conditions = await strategist.generate_conditions()
 
-        asyncio.run(run_test())
+        assert len(conditions) == 0
 
     def test_validate_condition_position_size(self, mock_llm, mock_market, mock_db):
         """Test position size validation."""
@@ -561,29 +545,25 @@ class TestStrategist:
         assert len(strategist.active_conditions) == 1
         assert strategist.active_conditions[0].coin == "SOL"
 
-    def test_callback_notification(self, mock_llm, mock_market, mock_db):
+    @pytest.mark.asyncio
+    async def test_callback_notification(self, mock_llm, mock_market, mock_db):
         """Test that callbacks are notified."""
-        import asyncio
-
-        async def run_test():
-            strategist = Strategist(
-                llm=mock_llm,
-                market_feed=mock_market,
-                db=mock_db,
-            )
-
-            callback = Mock()
-            strategist.subscribe_conditions(callback)
+        strategist = Strategist(
+            llm=mock_llm,
+            market_feed=mock_market,
+            db=mock_db,
+        )
 
-            conditions = await strategist.generate_conditions()
+        callback = Mock()
+        strategist.subscribe_conditions(callback)
 
-            # Notify callbacks (mimics what _run_once does)
-            if conditions:
-                strategist._notify_callbacks(conditions)
+        conditions = await strategist.generate_conditions()
 
-            callback.assert_called_once()
-            args = callback.call_args[0]
-            assert len(args[0]) == 1  # One condition
-            assert args[0][0].coin == "SOL"
+        # Notify callbacks (mimics what _run_once does)
+        if conditions:
+            strategist._notify_callbacks(conditions)
 
-        asyncio.run(run_test())
+        callback.assert_called_once()
+        args = callback.call_args[0]
+        assert len(args[0]) == 1  # One condition
+        assert args[0][0].coin == "SOL"
@@ -0,0 +1,237 @@
+"""
+Tests for TradingSystem in test mode.
+
+Drives the wired Sniper / TradeJournal / HealthMonitor stack through
+inject_condition() and inject_price() without connecting to an exchange.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from src.main import TradingSystem
+from src.models.trade_condition import TradeCondition
+
+
+def _condition(coin="BTC", trigger_price=50000.0, **overrides):
+    """Build a LONG/ABOVE TradeCondition with test defaults."""
+    fields = dict(
+        direction="LONG",
+        trigger_condition="ABOVE",
+        stop_loss_pct=2.0,
+        take_profit_pct=1.5,
+        position_size_usd=100.0,
+        reasoning="Test",
+        strategy_id="test",
+    )
+    fields.update(overrides)
+    return TradeCondition(coin=coin, trigger_price=trigger_price, **fields)
+
+
+# State files and file-backed databases go on tmpfs when it is available,
+# so save/load round-trips never wait on disk writeback.
+_RAM_TMPDIR = "/dev/shm" if sys.platform == "linux" and os.path.isdir("/dev/shm") else None
+
+
+@pytest.fixture(scope="session")
+def ram_root():
+    """Session temp root, on tmpfs where possible, removed once at the end."""
+    root = tempfile.mkdtemp(prefix="trading_system_", dir=_RAM_TMPDIR)
+    yield Path(root)
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def ram_tmp(ram_root):
+    """Per-test directory under the session root; no per-test teardown."""
+    return Path(tempfile.mkdtemp(dir=ram_root))
+
+
+@pytest.fixture(scope="class")
+def trading_system(ram_root):
+    """One started TradingSystem per test class.
+
+    Component wiring (journal, database, knowledge brain, sniper) runs once;
+    the per-test ``system`` fixture resets trading state in between. Both
+    databases are in-memory and separate, so journal tables and the system
+    Database tables are not shared as they are with an on-disk path; only
+    the sniper state file touches a filesystem.
+    The journal keeps its async writer, as in production; an in-memory
+    JournalDatabase serialises the writer thread and readers on one locked
+    connection, so tests may read while writes are in flight.
+    """
+    tmp = Path(tempfile.mkdtemp(dir=ram_root))
+    system = TradingSystem(
+        test_mode=True,
+        db_path=":memory:",
+        state_path=str(tmp / "sniper_state.json"),
+    )
+    asyncio.run(system.start_components())
+    yield system
+    asyncio.run(system.stop())
+
+
+@pytest.fixture
+def system(trading_system):
+    """The shared TradingSystem with conditions, positions and balance reset."""
+    trading_system.reset()
+    return trading_system
+
+
+class TestTradingSystemComponents:
+    """Test component initialization and wiring."""
+
+    def test_start_components(self, system):
+        assert system.journal is not None
+        assert system.db is not None
+        assert system.sniper is not None
+        assert system.market_feed is not None
+        assert system.health is not None
+        assert system.sniper.journal is system.journal
+
+    def test_callbacks_wired(self, system):
+        # Feed -> Sniper and Feed -> Health
+        assert len(system.market_feed._price_callbacks) == 2
+        assert system._on_execution in system.sniper._callbacks
+
+    def test_get_status(self, system):
+        status = system.get_status()
+
+        assert "sniper" in status
+        assert status["sniper"]["balance"] == system.initial_balance
+
+    def test_reset_restores_state(self, system):
+        system.inject_condition(_condition())
+        system.inject_price("BTC", 50100.0)
+        assert len(system.sniper.open_positions) == 1
+
+        system.reset()
+
+        assert system.sniper.active_conditions == {}
+        assert system.sniper.open_positions == {}
+        assert system.sniper.balance == system.initial_balance
+
+
+class TestEndToEnd:
+    """Test condition -> entry -> exit through the injected price path."""
+
+    def test_condition_trigger(self, system):
+        system.inject_condition(_condition())
+
+        system.inject_price("BTC", 49900.0)
+        assert len(system.sniper.open_positions) == 0
+
+        system.inject_price("BTC", 50100.0)
+        assert len(system.sniper.open_positions) == 1
+        position = next(iter(system.sniper.open_positions.values()))
+        assert position.entry_price == 50100.0
+
+    @pytest.mark.parametrize(
+        "stop_loss_pct, take_profit_pct, exit_price, exit_reason, pnl_sign",
+        [
+            (2.0, 10.0, 48900.0, "stop_loss", -1),  # -2.2%
+            (10.0, 1.5, 50800.0, "take_profit", 1),  # +1.6%
+        ],
+        ids=["stop_loss", "take_profit"],
+    )
+    def test_exit_behavior(self, system, stop_loss_pct, take_profit_pct,
+                           exit_price, exit_reason, pnl_sign):
+        system.inject_condition(_condition(stop_loss_pct=stop_loss_pct,
+                                           take_profit_pct=take_profit_pct))
+        system.inject_price("BTC", 50000.0)
+        assert len(system.sniper.open_positions) == 1
+        position_id = next(iter(system.sniper.open_positions))
+
+        system.inject_price("BTC", exit_price)
+
+        assert len(system.sniper.open_positions) == 0
+        assert system.sniper.total_pnl * pnl_sign > 0
+
+        assert system.journal.flush()
+        entry = system.journal.get_by_position(position_id)
+        assert entry.exit_reason == exit_reason
+
+    def test_inject_prices_batch(self, system):
+        system.inject_condition(_condition(stop_loss_pct=10.0, take_profit_pct=1.5))
+
+        system.inject_prices("btc", [49900.0, 50000.0, 50400.0, 50800.0])
+
+        assert len(system.sniper.open_positions) == 0
+        assert system.sniper.trades_executed == 1
+        assert system.sniper.total_pnl > 0
+        assert system.health._last_prices["BTC"] == 50800.0
+
+    def test_full_trade_cycle_journaled(self, system):
+        system.inject_condition(_condition())
+        system.inject_price("BTC", 50100.0)
+        position_id = next(iter(system.sniper.open_positions))
+
+        system.inject_price("BTC", 50900.0)  # +1.6%
+
+        # flush() waits for the write queue instead of sleeping on it
+        assert system.journal.flush()
+        entry = system.journal.db.get_by_position(position_id)
+        assert entry is not None
+        assert entry.status == "closed"
+        assert entry.entry_price == 50100.0
+        assert entry.exit_price == 50900.0
+        assert entry.pnl_usd > 0
+
+    def test_journal_reads_during_async_writes(self, system):
+        before = system.journal.get_stats()["total_trades"]
+
+        for _ in range(50):
+            system.inject_condition(_condition())
+            system.inject_price("BTC", 50100.0)
+            system.inject_price("BTC", 50900.0)  # take profit
+            system.journal.get_stats()  # Read while the writer is busy
+
+        assert system.journal.flush()
+        assert system.journal.get_stats()["total_trades"] == before + 50
+
+
+@pytest.mark.wallclock
+class TestPerformance:
+    """Test tick throughput through the full system path."""
+
+    def test_tick_processing_speed(self, system):
+        for i in range(5):
+            system.inject_condition(_condition("ETH", 90000.0 + i * 100))
+
+        ticks = 10000
+        prices = [50000.0 + i * 0.01 for i in range(ticks)]
+        start = time.perf_counter()
+        system.inject_prices("BTC", prices)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed / ticks * 1000 < 0.1  # < 0.1 ms per tick
+
+
+class TestStatePersistence:
+    """Test sniper state survives a restart."""
+
+    def test_state_save_and_load(self, ram_tmp):
+        # File-backed: the restarted system must reopen the same database
+        db_path = str(ram_tmp / "test.db")
+        state_path = str(ram_tmp / "sniper_state.json")
+
+        system1 = TradingSystem(test_mode=True, db_path=db_path, state_path=state_path)
+        asyncio.run(system1.start_components())
+        system1.inject_condition(_condition())
+        system1.inject_price("BTC", 50100.0)
+        assert len(system1.sniper.open_positions) == 1
+        asyncio.run(system1.stop())  # saves sniper state
+
+        system2 = TradingSystem(test_mode=True, db_path=db_path, state_path=state_path)
+        asyncio.run(system2.start_components())
+        try:
+            assert len(system2.sniper.open_positions) == 1
+            assert system2.sniper.balance == system1.sniper.balance
+        finally:
+            asyncio.run(system2.stop())